@@ -247,6 +247,51 @@ def get_rate_limit_storage_uri(config: RateLimitConfig | None = None) -> str:
     return f"redis://{config.redis_host}:{config.redis_port}/0"
 
 
+@dataclass
+class CacheConfig:
+    """Response cache configuration."""
+
+    enabled: bool = False
+    redis_host: str | None = None
+    redis_port: int = DEFAULT_REDIS_PORT
+    redis_password: str | None = None
+
+
+def load_cache_config() -> CacheConfig:
+    """Load response cache configuration from environment variables.
+
+    Returns:
+        CacheConfig: Cache configuration
+    """
+    return CacheConfig(
+        enabled=os.getenv("CACHE_ENABLED", "false").lower() == "true",
+        redis_host=os.getenv("REDIS_HOST"),
+        redis_port=int(os.getenv("REDIS_PORT", str(DEFAULT_REDIS_PORT))),
+        redis_password=os.getenv("REDIS_PASSWORD"),
+    )
+
+
+def get_cache_redis_url(config: CacheConfig | None = None) -> str | None:
+    """Get Redis URL for the response cache.
+
+    Args:
+        config: Optional cache config. If not provided, loads from environment.
+
+    Returns:
+        Redis URL if caching is enabled and Redis is configured, otherwise None
+    """
+    if config is None:
+        config = load_cache_config()
+
+    if not config.enabled or not config.redis_host:
+        return None
+
+    # Database 1 keeps cached responses apart from rate limit counters (database 0)
+    if config.redis_password:
+        return f"redis://:{config.redis_password}@{config.redis_host}:{config.redis_port}/1"
+    return f"redis://{config.redis_host}:{config.redis_port}/1"
+
+
 class Config:
     """Base configuration loaded from environment variables."""
 
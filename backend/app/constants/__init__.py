@@ -5,10 +5,22 @@ from app.constants.agent import (
     DEFAULT_LLM_PROVIDER,
     DEFAULT_MAX_TOKENS,
     MAX_CONVERSATION_TITLE_LENGTH,
+    MAX_RETRY_DELAY,
+    MESSAGE_HISTORY_MAX_CHARS,
+    MESSAGE_HISTORY_MAX_MESSAGES,
+    RETRY_BACKOFF_MULTIPLIER,
+    STREAM_DELTA_COALESCE_CHARS,
+    STREAM_DELTA_COALESCE_SECONDS,
+    STREAM_PREFETCH_MAX_CHUNKS,
     TITLE_TRUNCATION_LENGTH,
     TITLE_TRUNCATION_SUFFIX,
 )
-from app.constants.database import CLOUD_SQL_IP_TYPE_PRIVATE, CLOUD_SQL_IP_TYPE_PUBLIC, DEFAULT_MAX_OVERFLOW, DEFAULT_POOL_SIZE
+from app.constants.database import (
+    CLOUD_SQL_IP_TYPE_PRIVATE,
+    CLOUD_SQL_IP_TYPE_PUBLIC,
+    DEFAULT_MAX_OVERFLOW,
+    DEFAULT_POOL_SIZE,
+)
 from app.constants.http import (
     HTTP_BAD_REQUEST,
     HTTP_CREATED,
@@ -41,7 +53,17 @@ from app.constants.rate_limit import (
     REFRESH_RATE_LIMIT,
     SEND_MESSAGE_RATE_LIMIT,
 )
-from app.constants.redis import DEFAULT_REDIS_PORT, DEFAULT_SOCKET_CONNECT_TIMEOUT, DEFAULT_SOCKET_TIMEOUT
+from app.constants.redis import (
+    CACHE_SOCKET_TIMEOUT,
+    CACHE_VERSION_TTL,
+    CONVERSATION_DETAIL_CACHE_KEY_PREFIX,
+    CONVERSATION_DETAIL_CACHE_TTL,
+    CONVERSATION_LIST_CACHE_KEY_PREFIX,
+    CONVERSATION_LIST_CACHE_TTL,
+    DEFAULT_REDIS_PORT,
+    DEFAULT_SOCKET_CONNECT_TIMEOUT,
+    DEFAULT_SOCKET_TIMEOUT,
+)
 from app.constants.sse_events import SERVICE_TO_SSE_EVENT_MAP, SSEEvent
 from app.constants.validation import (
     COST_DECIMAL_PLACES,
@@ -66,6 +88,13 @@ __all__ = [
     "DEFAULT_LLM_PROVIDER",
     "DEFAULT_MAX_TOKENS",
     "MAX_CONVERSATION_TITLE_LENGTH",
+    "MAX_RETRY_DELAY",
+    "MESSAGE_HISTORY_MAX_MESSAGES",
+    "MESSAGE_HISTORY_MAX_CHARS",
+    "RETRY_BACKOFF_MULTIPLIER",
+    "STREAM_PREFETCH_MAX_CHUNKS",
+    "STREAM_DELTA_COALESCE_CHARS",
+    "STREAM_DELTA_COALESCE_SECONDS",
     "TITLE_TRUNCATION_LENGTH",
     "TITLE_TRUNCATION_SUFFIX",
     # Database
@@ -109,6 +138,12 @@ __all__ = [
     "REFRESH_RATE_LIMIT",
     "SEND_MESSAGE_RATE_LIMIT",
     # Redis
+    "CACHE_SOCKET_TIMEOUT",
+    "CACHE_VERSION_TTL",
+    "CONVERSATION_DETAIL_CACHE_KEY_PREFIX",
+    "CONVERSATION_DETAIL_CACHE_TTL",
+    "CONVERSATION_LIST_CACHE_KEY_PREFIX",
+    "CONVERSATION_LIST_CACHE_TTL",
     "DEFAULT_REDIS_PORT",
     "DEFAULT_SOCKET_CONNECT_TIMEOUT",
     "DEFAULT_SOCKET_TIMEOUT",
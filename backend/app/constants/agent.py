@@ -12,6 +12,21 @@ MAX_CONVERSATION_TITLE_LENGTH = 50
 TITLE_TRUNCATION_SUFFIX = "..."
 TITLE_TRUNCATION_LENGTH = 47  # MAX_CONVERSATION_TITLE_LENGTH - len(TITLE_TRUNCATION_SUFFIX)
 
+# Retry backoff (decorrelated jitter)
+RETRY_BACKOFF_MULTIPLIER = 3  # Upper bound of the next delay relative to the previous one
+MAX_RETRY_DELAY = 30.0  # Seconds
+
+# Agent stream read-ahead
+STREAM_PREFETCH_MAX_CHUNKS = 32  # Bounded so a slow client applies back-pressure upstream
+
+# Message history sent to the LLM: the newest messages up to both limits
+MESSAGE_HISTORY_MAX_MESSAGES = 20
+MESSAGE_HISTORY_MAX_CHARS = 32_000
+
+# Text deltas sent to the client are coalesced until either limit is reached
+STREAM_DELTA_COALESCE_CHARS = 64
+STREAM_DELTA_COALESCE_SECONDS = 0.02  # Measured from the previous delta sent; also the upstream idle timeout
+
 __all__ = [
     "DEFAULT_LLM_PROVIDER",
     "DEFAULT_LLM_MODEL",
@@ -19,4 +34,11 @@ __all__ = [
     "MAX_CONVERSATION_TITLE_LENGTH",
     "TITLE_TRUNCATION_SUFFIX",
     "TITLE_TRUNCATION_LENGTH",
+    "RETRY_BACKOFF_MULTIPLIER",
+    "MAX_RETRY_DELAY",
+    "MESSAGE_HISTORY_MAX_MESSAGES",
+    "MESSAGE_HISTORY_MAX_CHARS",
+    "STREAM_PREFETCH_MAX_CHUNKS",
+    "STREAM_DELTA_COALESCE_CHARS",
+    "STREAM_DELTA_COALESCE_SECONDS",
 ]
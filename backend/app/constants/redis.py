@@ -7,8 +7,22 @@ DEFAULT_REDIS_PORT = 6379
 DEFAULT_SOCKET_CONNECT_TIMEOUT = 30
 DEFAULT_SOCKET_TIMEOUT = 30
 
+# Response cache settings
+CACHE_SOCKET_TIMEOUT = 1  # Seconds; a slow cache must not stall requests
+CACHE_VERSION_TTL = 86400  # Seconds; outlives every entry keyed by a version
+CONVERSATION_LIST_CACHE_KEY_PREFIX = "convlist"
+CONVERSATION_LIST_CACHE_TTL = 30  # Seconds
+CONVERSATION_DETAIL_CACHE_KEY_PREFIX = "conv"
+CONVERSATION_DETAIL_CACHE_TTL = 120  # Seconds
+
 __all__ = [
     "DEFAULT_REDIS_PORT",
     "DEFAULT_SOCKET_CONNECT_TIMEOUT",
     "DEFAULT_SOCKET_TIMEOUT",
+    "CACHE_SOCKET_TIMEOUT",
+    "CACHE_VERSION_TTL",
+    "CONVERSATION_LIST_CACHE_KEY_PREFIX",
+    "CONVERSATION_LIST_CACHE_TTL",
+    "CONVERSATION_DETAIL_CACHE_KEY_PREFIX",
+    "CONVERSATION_DETAIL_CACHE_TTL",
 ]
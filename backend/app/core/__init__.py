@@ -6,6 +6,7 @@ from app.core.exceptions import (
     ConversationAccessDeniedError,
     ConversationNotFoundError,
     ConversationServiceError,
+    InvalidConversationCursorError,
     InvalidCredentialsError,
     InvalidPasswordError,
     InvalidRefreshTokenError,
@@ -28,6 +29,7 @@ __all__ = [
     "CannotDeleteAdminError",
     "ConversationServiceError",
     "ConversationNotFoundError",
+    "InvalidConversationCursorError",
     "ConversationAccessDeniedError",
     "PasswordServiceError",
     "InvalidPasswordError",
@@ -97,6 +97,14 @@ class ConversationAccessDeniedError(ConversationServiceError):
         self.uuid = uuid
 
 
+class InvalidConversationCursorError(ConversationServiceError):
+    """Raised when a conversation list cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        super().__init__("ページングカーソルが不正です", {"cursor": cursor})
+        self.cursor = cursor
+
+
 # === Password Exceptions ===
 
 
@@ -238,6 +246,7 @@ __all__ = [
     "ConversationServiceError",
     "ConversationNotFoundError",
     "ConversationAccessDeniedError",
+    "InvalidConversationCursorError",
     "PasswordServiceError",
     "InvalidPasswordError",
     "PasswordChangeFailedError",
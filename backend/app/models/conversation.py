@@ -23,6 +23,7 @@ class Conversation(Base):
     __table_args__ = (
         Index("idx_conversations_user_id", "user_id"),
         Index("idx_conversations_updated_at", "updated_at"),
+        Index("idx_conversations_user_id_updated_at", "user_id", "updated_at"),
         {"sqlite_autoincrement": True},
     )
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import uuid as uuid_module
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING, Sequence
 
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import exists, func, tuple_
+from sqlalchemy.orm import selectinload
 
 from app.constants.pagination import DEFAULT_PER_PAGE
 from app.models.conversation import Conversation
@@ -17,6 +19,15 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 
+@dataclass(frozen=True, slots=True)
+class ConversationHandle:
+    """Identity and ownership columns of a conversation, for paths that need no other data."""
+
+    id: int
+    user_id: int
+    uuid: str
+
+
 class ConversationRepository(BaseRepository):
     """Repository for Conversation model database operations."""
 
@@ -24,29 +35,76 @@ class ConversationRepository(BaseRepository):
         """Initialize repository with database session."""
         super().__init__(session)
 
-    def find_by_uuid(self, uuid: str) -> Conversation | None:
+    def find_by_uuid(self, uuid: str, *, user_id: int | None = None) -> Conversation | None:
         """
         Find a conversation by UUID.
 
         Args:
             uuid: UUID to search for
+            user_id: If given, only match a conversation owned by this user
 
         Returns:
             Conversation if found, None otherwise
         """
-        return self.session.query(Conversation).filter(Conversation.uuid == uuid).first()
+        query = self.session.query(Conversation).filter(Conversation.uuid == uuid)
+        if user_id is not None:
+            query = query.filter(Conversation.user_id == user_id)
+        return query.first()
+
+    def exists_by_uuid(self, uuid: str) -> bool:
+        """
+        Check whether a conversation with the UUID exists, without loading it.
 
-    def find_by_uuid_with_messages(self, uuid: str) -> Conversation | None:
+        Args:
+            uuid: UUID to search for
+
+        Returns:
+            True if a conversation with the UUID exists
+        """
+        return self.session.query(exists().where(Conversation.uuid == uuid)).scalar()
+
+    def find_handle_by_uuid(self, uuid: str) -> ConversationHandle | None:
+        """
+        Find a conversation's id, owner, and UUID without loading the entity.
+
+        Args:
+            uuid: UUID to search for
+
+        Returns:
+            ConversationHandle if found, None otherwise
+        """
+        row = self.session.query(Conversation.id, Conversation.user_id, Conversation.uuid).filter(Conversation.uuid == uuid).first()
+        return ConversationHandle(*row) if row else None
+
+    def find_by_uuid_with_messages(
+        self,
+        uuid: str,
+        *,
+        user_id: int | None = None,
+        with_tool_calls: bool = True,
+    ) -> Conversation | None:
         """
         Find a conversation by UUID with messages eagerly loaded.
 
+        Messages (and optionally their tool calls) are loaded with selectinload, so
+        building a detail response costs a fixed number of queries regardless of
+        message count and never triggers a lazy load.
+
         Args:
             uuid: UUID to search for
+            user_id: If given, only match (and load messages for) a conversation owned by this user
+            with_tool_calls: If True, also load each message's tool calls
 
         Returns:
             Conversation with messages if found, None otherwise
         """
-        return self.session.query(Conversation).options(joinedload(Conversation.messages)).filter(Conversation.uuid == uuid).first()
+        messages_loader = selectinload(Conversation.messages)
+        if with_tool_calls:
+            messages_loader = messages_loader.selectinload(Message.tool_calls)
+        query = self.session.query(Conversation).options(messages_loader).filter(Conversation.uuid == uuid)
+        if user_id is not None:
+            query = query.filter(Conversation.user_id == user_id)
+        return query.one_or_none()
 
     def find_by_user_id(
         self,
@@ -85,55 +143,115 @@ class ConversationRepository(BaseRepository):
         """
         return self.session.query(Conversation).filter(Conversation.user_id == user_id).all()
 
+    def find_uuids_by_user_id(self, user_id: int) -> list[str]:
+        """
+        Find the UUIDs of all conversations for a user without loading them.
+
+        Args:
+            user_id: User ID to filter by
+
+        Returns:
+            List of conversation UUIDs
+        """
+        return [uuid for (uuid,) in self.session.query(Conversation.uuid).filter(Conversation.user_id == user_id)]
+
     def find_by_user_id_with_message_count(
         self,
         user_id: int,
         page: int = 1,
         per_page: int = DEFAULT_PER_PAGE,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[tuple[Conversation, int]], int]:
         """
         Find all conversations for a user with message counts.
 
+        The page and its total (a COUNT(*) OVER () window on the same rows) are read
+        first, then messages are counted for that page's conversations only, so the
+        cost follows the page size rather than the user's whole message history.
+        A separate total query runs only when the requested page is past the end.
+
         Args:
             user_id: User ID to filter by
             page: Page number (1-indexed)
             per_page: Number of items per page
 
         Returns:
-            Tuple of (list of dicts with conversation and message_count, total count)
+            Tuple of (list of (conversation, message_count) tuples, total count)
         """
-        # Subquery to count messages per conversation
-        message_count_subquery = (
-            self.session.query(
-                Message.conversation_id,
-                func.count(Message.id).label("message_count"),
-            )
-            .group_by(Message.conversation_id)
-            .subquery()
-        )
-
         query = (
             self.session.query(
                 Conversation,
-                func.coalesce(message_count_subquery.c.message_count, 0).label("message_count"),
-            )
-            .outerjoin(
-                message_count_subquery,
-                Conversation.id == message_count_subquery.c.conversation_id,
+                # Evaluated before LIMIT: the number of the user's conversations
+                func.count().over().label("total"),
             )
             .filter(Conversation.user_id == user_id)
-            .order_by(Conversation.updated_at.desc())
+            .order_by(Conversation.updated_at.desc(), Conversation.id.desc())
         )
 
-        # Get total count
-        total = self.session.query(Conversation).filter(Conversation.user_id == user_id).count()
-
         offset = (page - 1) * per_page
         results = query.offset(offset).limit(per_page).all()
 
-        conversations_with_count = [{"conversation": conv, "message_count": count} for conv, count in results]
+        if results:
+            total = results[0].total
+        elif offset:
+            # Past the last page: no row carries the window total
+            total = self.session.query(func.count(Conversation.id)).filter(Conversation.user_id == user_id).scalar() or 0
+        else:
+            total = 0
 
-        return conversations_with_count, total
+        conversations = [conv for conv, _total in results]
+        return self._with_message_counts(conversations), total
+
+    def find_by_user_id_with_message_count_after(
+        self,
+        user_id: int,
+        cursor: tuple[datetime, int] | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> tuple[list[tuple[Conversation, int]], bool]:
+        """
+        Find a page of conversations for a user with message counts using keyset pagination.
+
+        Rows are ordered by (updated_at, id) descending and the page starts right
+        after the cursor, so deep pages seek through the (user_id, updated_at)
+        index instead of scanning and discarding an offset. No total is counted.
+
+        Args:
+            user_id: User ID to filter by
+            cursor: (updated_at, id) of the last row of the previous page, or None for the first page
+            per_page: Number of items per page
+
+        Returns:
+            Tuple of (list of (conversation, message_count) tuples, whether more rows follow)
+        """
+        query = self.session.query(Conversation).filter(Conversation.user_id == user_id)
+        if cursor is not None:
+            query = query.filter(tuple_(Conversation.updated_at, Conversation.id) < tuple_(*cursor))
+
+        # Fetch one extra row to learn whether another page exists
+        results = query.order_by(Conversation.updated_at.desc(), Conversation.id.desc()).limit(per_page + 1).all()
+
+        has_more = len(results) > per_page
+        return self._with_message_counts(results[:per_page]), has_more
+
+    def _with_message_counts(self, conversations: Sequence[Conversation]) -> list[tuple[Conversation, int]]:
+        """
+        Pair conversations with their message counts using one grouped COUNT query.
+
+        Args:
+            conversations: Conversations of one page
+
+        Returns:
+            List of (conversation, message_count) tuples in the given order
+        """
+        if not conversations:
+            return []
+
+        counts = dict(
+            self.session.query(Message.conversation_id, func.count(Message.id))
+            .filter(Message.conversation_id.in_([conv.id for conv in conversations]))
+            .group_by(Message.conversation_id)
+            .all()
+        )
+        return [(conv, counts.get(conv.id, 0)) for conv in conversations]
 
     def create(self, user_id: int, title: str) -> Conversation:
         """
@@ -169,18 +287,23 @@ class ConversationRepository(BaseRepository):
         conversation.title = title
         return conversation
 
-    def touch(self, conversation: Conversation) -> Conversation:
+    def touch(self, conversation: Conversation | ConversationHandle) -> None:
         """
         Update conversation's updated_at timestamp.
 
-        Args:
-            conversation: Conversation to touch
+        A loaded Conversation is updated in the next flush. A ConversationHandle has no
+        entity to change, so its row is updated with a single UPDATE by primary key.
 
-        Returns:
-            Updated Conversation instance
+        Args:
+            conversation: Conversation or ConversationHandle to touch
         """
-        conversation.updated_at = func.now()
-        return conversation
+        if isinstance(conversation, Conversation):
+            conversation.updated_at = func.now()
+            return
+        self.session.query(Conversation).filter(Conversation.id == conversation.id).update(
+            {Conversation.updated_at: func.now()},
+            synchronize_session=False,
+        )
 
     def delete(self, conversation: Conversation) -> None:
         """
@@ -249,28 +372,7 @@ class ConversationRepository(BaseRepository):
             filter_conditions.append(Conversation.user_id == user_id)
         filter_conditions.extend(self._build_date_filters(start_date, end_date))
 
-        # Subquery to count messages per conversation
-        message_count_subquery = (
-            self.session.query(
-                Message.conversation_id,
-                func.count(Message.id).label("message_count"),
-            )
-            .group_by(Message.conversation_id)
-            .subquery()
-        )
-
-        query = (
-            self.session.query(
-                Conversation,
-                User,
-                func.coalesce(message_count_subquery.c.message_count, 0).label("message_count"),
-            )
-            .join(User, Conversation.user_id == User.id)
-            .outerjoin(
-                message_count_subquery,
-                Conversation.id == message_count_subquery.c.conversation_id,
-            )
-        )
+        query = self.session.query(Conversation, User).join(User, Conversation.user_id == User.id)
 
         # Apply all filters
         for condition in filter_conditions:
@@ -287,16 +389,18 @@ class ConversationRepository(BaseRepository):
         offset = (page - 1) * per_page
         results = query.offset(offset).limit(per_page).all()
 
+        # Messages are counted for this page's conversations only
+        counts = self._with_message_counts([conv for conv, _user in results])
         conversations_with_user = [
             {
                 "conversation": conv,
                 "user": user,
                 "message_count": count,
             }
-            for conv, user, count in results
+            for (conv, count), (_conv, user) in zip(counts, results)
         ]
 
         return conversations_with_user, total
 
 
-__all__ = ["ConversationRepository"]
+__all__ = ["ConversationHandle", "ConversationRepository"]
@@ -30,6 +30,34 @@ class MessageRepository(BaseRepository):
         """
         return self.session.query(Message).filter(Message.conversation_id == conversation_id).order_by(Message.created_at.asc()).all()
 
+    def find_recent_role_content_pairs(
+        self,
+        conversation_id: int,
+        limit: int,
+        *,
+        before_id: int | None = None,
+    ) -> list[tuple[str, str]]:
+        """
+        Find the newest (role, content) pairs of a conversation, oldest first.
+
+        Selects only the two columns with one ORDER BY ... DESC LIMIT query, so
+        building LLM message history neither hydrates Message rows nor reads
+        more than limit rows however long the conversation grows.
+
+        Args:
+            conversation_id: Conversation ID to filter by
+            limit: Maximum number of messages to return
+            before_id: If given, only messages with a smaller ID are returned
+
+        Returns:
+            List of (role, content) pairs in conversation order
+        """
+        query = self.session.query(Message.role, Message.content).filter(Message.conversation_id == conversation_id)
+        if before_id is not None:
+            query = query.filter(Message.id < before_id)
+        rows = query.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit).all()
+        return [(row.role, row.content) for row in reversed(rows)]
+
     def create(
         self,
         conversation_id: int,
@@ -72,6 +100,24 @@ class MessageRepository(BaseRepository):
         self.session.flush()
         return message
 
+    def create_exchange(self, conversation_id: int, content: str) -> tuple[Message, Message]:
+        """
+        Create a user message and an empty assistant placeholder with a single flush.
+
+        Args:
+            conversation_id: Parent conversation ID
+            content: User message content
+
+        Returns:
+            Tuple of (user_message, assistant_message)
+        """
+        user_message = Message(conversation_id=conversation_id, role="user", content=content)
+        assistant_message = Message(conversation_id=conversation_id, role="assistant", content="")
+        # Added in order so the unit of work inserts the user message first
+        self.session.add_all([user_message, assistant_message])
+        self.session.flush()
+        return user_message, assistant_message
+
     def update_metadata(
         self,
         message_id: int,
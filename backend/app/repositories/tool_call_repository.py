@@ -134,8 +134,7 @@ class ToolCallRepository(BaseRepository):
 
         This method is optimized for streaming scenarios where tool calls
         are buffered in memory and written to the database after streaming
-        completes. This reduces the number of database round-trips and
-        improves performance.
+        completes. All rows are added to the session and written by one flush.
 
         Args:
             message_id: Parent message ID for all tool calls
@@ -147,9 +146,32 @@ class ToolCallRepository(BaseRepository):
         if not tool_calls:
             return []
 
-        created_tool_calls = []
-        for data in tool_calls:
-            tool_call = ToolCall(
+        created_tool_calls = self.add_batch(message_id, tool_calls)
+
+        # Single flush for all tool calls
+        self.session.flush()
+        return created_tool_calls
+
+    def add_batch(
+        self,
+        message_id: int,
+        tool_calls: Sequence[ToolCallData],
+    ) -> list[ToolCall]:
+        """
+        Add multiple tool call records to the session without flushing.
+
+        The rows are inserted by the next flush or commit of the session, so
+        callers on a connection-close path do not wait on database I/O.
+
+        Args:
+            message_id: Parent message ID for all tool calls
+            tool_calls: Sequence of ToolCallData instances to persist
+
+        Returns:
+            List of pending ToolCall instances
+        """
+        pending_tool_calls = [
+            ToolCall(
                 message_id=message_id,
                 tool_call_id=data.tool_call_id,
                 tool_name=data.tool_name,
@@ -160,12 +182,10 @@ class ToolCallRepository(BaseRepository):
                 started_at=data.started_at,
                 completed_at=data.completed_at,
             )
-            self.session.add(tool_call)
-            created_tool_calls.append(tool_call)
-
-        # Single flush for all tool calls
-        self.session.flush()
-        return created_tool_calls
+            for data in tool_calls
+        ]
+        self.session.add_all(pending_tool_calls)
+        return pending_tool_calls
 
 
 __all__ = ["ToolCallRepository", "ToolCallData"]
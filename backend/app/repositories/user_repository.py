@@ -34,13 +34,16 @@ class UserRepository(BaseRepository):
         """
         Find a user by ID.
 
+        Uses the session's identity map, so a user already loaded in this
+        session is returned without another query.
+
         Args:
             user_id: User ID to search for
 
         Returns:
             User if found, None otherwise
         """
-        return self.session.query(User).filter(User.id == user_id).first()
+        return self.session.get(User, user_id)
 
     def find_by_email_excluding_id(self, email: str, user_id: int) -> User | None:
         """
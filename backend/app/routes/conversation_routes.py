@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+from json.encoder import encode_basestring_ascii
 
 from flask import Blueprint, Response, g, jsonify, request, stream_with_context
 from werkzeug.exceptions import Forbidden, NotFound
@@ -32,6 +33,31 @@ logger = logging.getLogger(__name__)
 
 conversation_bp = Blueprint("conversations", __name__, url_prefix="/conversations")
 
+# Pre-encoded "event: ...\ndata: " prefixes per service event type
+_SSE_PREFIXES = {event_type: f"event: {sse_event}\ndata: ".encode() for event_type, sse_event in SERVICE_TO_SSE_EVENT_MAP.items()}
+_SSE_DELTA_PREFIX = _SSE_PREFIXES["delta"] + b'{"delta": '
+
+
+def _format_sse(event_type: str, event_data: dict) -> bytes | None:
+    """Encode a service event as an SSE frame.
+
+    Delta events, emitted once per token, skip the generic dict encoder and
+    produce the same bytes as json.dumps directly from the delta string.
+
+    Args:
+        event_type: Service event type
+        event_data: Event payload
+
+    Returns:
+        Encoded SSE frame, or None if the event type is not sent to clients
+    """
+    if event_type == "delta":
+        return _SSE_DELTA_PREFIX + encode_basestring_ascii(event_data["delta"]).encode() + b"}\n\n"
+    prefix = _SSE_PREFIXES.get(event_type)
+    if prefix is None:
+        return None
+    return prefix + json.dumps(event_data).encode() + b"\n\n"
+
 
 def _build_llm_error_data(exc: Exception, user_message_id: int | None = None) -> dict:
     """Build error data dict with LLM-specific error details.
@@ -105,6 +131,8 @@ def list_conversations(*, conversation_service: ConversationService):
     Query parameters:
         page (int, optional): Page number (default: 1)
         per_page (int, optional): Items per page (default: 20, max: 100)
+        cursor (str, optional): Switches to keyset pagination; pass an empty value
+            for the first page, then meta.next_cursor. page is ignored.
 
     Returns:
         {
@@ -116,13 +144,25 @@ def list_conversations(*, conversation_service: ConversationService):
                 "total_pages": 3
             }
         }
+
+        With cursor, meta is {"per_page": 20, "has_more": true, "next_cursor": "..."}.
     """
     user_id = g.user_id
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", DEFAULT_PER_PAGE, type=int)
+    cursor = request.args.get("cursor")
 
     logger.info(f"GET /api/conversations - Listing conversations for user_id={user_id}")
 
+    if cursor is not None:
+        cursor_response = conversation_service.list_conversations_after(
+            user_id=user_id,
+            cursor=cursor or None,
+            per_page=per_page,
+        )
+        logger.info(f"GET /api/conversations - Retrieved {len(cursor_response.conversations)} conversations")
+        return jsonify(cursor_response.model_dump(mode="json")), HTTP_OK
+
     response = conversation_service.list_conversations(
         user_id=user_id,
         page=page,
@@ -184,9 +224,9 @@ def create_conversation(*, data: CreateConversationRequest, conversation_service
                 ):
                     if event_type == "created":
                         user_message_id = event_data.get("user_message_id")
-                    sse_event = SERVICE_TO_SSE_EVENT_MAP.get(event_type)
-                    if sse_event:
-                        yield f"event: {sse_event}\ndata: {json.dumps(event_data)}\n\n"
+                    frame = _format_sse(event_type, event_data)
+                    if frame is not None:
+                        yield frame
             except Exception as exc:
                 logger.error("Error during conversation creation streaming", exc_info=True)
                 error_data = _build_llm_error_data(exc, user_message_id)
@@ -313,7 +353,7 @@ def send_message(uuid: str, *, data: SendMessageRequest, conversation_service: C
         # Validate conversation access BEFORE starting stream
         # This allows proper HTTP error codes (404/403) to be returned
         try:
-            conversation_service.validate_conversation_access(uuid=uuid, user_id=user_id)
+            conversation_service.validate_conversation_handle(uuid=uuid, user_id=user_id)
         except ConversationNotFoundError as exc:
             raise NotFound(description=str(exc)) from exc
         except ConversationAccessDeniedError as exc:
@@ -330,9 +370,9 @@ def send_message(uuid: str, *, data: SendMessageRequest, conversation_service: C
                 ):
                     if event_type == "start":
                         user_message_id = event_data.get("user_message_id")
-                    sse_event = SERVICE_TO_SSE_EVENT_MAP.get(event_type)
-                    if sse_event:
-                        yield f"event: {sse_event}\ndata: {json.dumps(event_data)}\n\n"
+                    frame = _format_sse(event_type, event_data)
+                    if frame is not None:
+                        yield frame
             except Exception as exc:
                 logger.error("Error during streaming", exc_info=True)
                 error_data = _build_llm_error_data(exc, user_message_id)
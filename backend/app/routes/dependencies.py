@@ -19,6 +19,7 @@ from app.core.exceptions import (
     ConversationServiceError,
     DatabaseConnectionError,
     DuplicateEntryError,
+    InvalidConversationCursorError,
     InvalidCredentialsError,
     InvalidPasswordError,
     InvalidRefreshTokenError,
@@ -290,6 +291,7 @@ _AUTH_ERROR_MAPPING: ErrorMapping = {
 _CONVERSATION_ERROR_MAPPING: ErrorMapping = {
     ConversationNotFoundError: NotFound,
     ConversationAccessDeniedError: Forbidden,
+    InvalidConversationCursorError: BadRequest,
 }
 
 _PASSWORD_ERROR_MAPPING: ErrorMapping = {
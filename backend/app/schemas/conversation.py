@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 from pydantic import BaseModel, field_validator
 
 from app.schemas.tool_call import ToolCallResponse
 from app.schemas.validators import validate_message_content
 
+if TYPE_CHECKING:
+    from app.models.conversation import Conversation
+    from app.models.message import Message
+
 
 class CreateConversationRequest(BaseModel):
     """Request schema for creating a new conversation."""
@@ -53,6 +57,29 @@ class MessageResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_fast(cls, message: Message, *, with_tool_calls: bool = True) -> MessageResponse:
+        """Build from a trusted Message row without running validation.
+
+        Args:
+            message: Message row
+            with_tool_calls: If False, skip the tool_calls relationship (e.g. a new message)
+        """
+        cost_usd = message.cost_usd
+        return cls.model_construct(
+            id=message.id,
+            role=message.role,
+            content=message.content,
+            tool_calls=[ToolCallResponse.from_orm_fast(tc) for tc in message.tool_calls] if with_tool_calls else [],
+            created_at=message.created_at,
+            input_tokens=message.input_tokens,
+            output_tokens=message.output_tokens,
+            model=message.model,
+            response_time_ms=message.response_time_ms,
+            # Numeric columns load as Decimal; validation would have coerced to float
+            cost_usd=float(cost_usd) if cost_usd is not None else None,
+        )
+
 
 class ConversationResponse(BaseModel):
     """Response schema for a conversation (without messages)."""
@@ -64,6 +91,16 @@ class ConversationResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_fast(cls, conversation: Conversation) -> ConversationResponse:
+        """Build from a trusted Conversation row without running validation."""
+        return cls.model_construct(
+            uuid=conversation.uuid,
+            title=conversation.title,
+            created_at=conversation.created_at,
+            updated_at=conversation.updated_at,
+        )
+
 
 class ConversationWithCountResponse(BaseModel):
     """Response schema for a conversation with message count."""
@@ -74,6 +111,17 @@ class ConversationWithCountResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_orm_fast(cls, conversation: Conversation, message_count: int) -> ConversationWithCountResponse:
+        """Build from a trusted Conversation row and its message count without running validation."""
+        return cls.model_construct(
+            uuid=conversation.uuid,
+            title=conversation.title,
+            message_count=message_count,
+            created_at=conversation.created_at,
+            updated_at=conversation.updated_at,
+        )
+
 
 class ConversationDetailResponse(BaseModel):
     """Response schema for conversation with messages."""
@@ -98,6 +146,21 @@ class ConversationListResponse(BaseModel):
     meta: PaginationMeta
 
 
+class CursorPaginationMeta(BaseModel):
+    """Keyset pagination metadata."""
+
+    per_page: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+
+class ConversationCursorListResponse(BaseModel):
+    """Response schema for a keyset-paginated conversation list."""
+
+    conversations: list[ConversationWithCountResponse]
+    meta: CursorPaginationMeta
+
+
 class CreateConversationResponse(BaseModel):
     """Response schema for creating a new conversation."""
 
@@ -122,6 +185,8 @@ __all__ = [
     "ConversationDetailResponse",
     "ConversationListResponse",
     "PaginationMeta",
+    "ConversationCursorListResponse",
+    "CursorPaginationMeta",
     "CreateConversationResponse",
     "SendMessageResponse",
 ]
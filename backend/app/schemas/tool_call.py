@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from app.models.tool_call import ToolCall
+
 
 class ToolCallResponse(BaseModel):
     """Response schema for a tool call."""
@@ -23,6 +26,43 @@ class ToolCallResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_fast(cls, tool_call: ToolCall) -> ToolCallResponse:
+        """Build from a trusted ToolCall row without running validation."""
+        return cls.model_construct(
+            id=tool_call.id,
+            tool_call_id=tool_call.tool_call_id,
+            tool_name=tool_call.tool_name,
+            input=tool_call.input,
+            output=tool_call.output,
+            error=tool_call.error,
+            status=tool_call.status,
+            started_at=tool_call.started_at,
+            completed_at=tool_call.completed_at,
+        )
+
+    @staticmethod
+    def dump_orm_json(tool_call: ToolCall) -> dict[str, Any]:
+        """Serialize a ToolCall row to the same dict as ``model_dump(mode="json")`` without building a model."""
+        completed_at = tool_call.completed_at
+        return {
+            "id": tool_call.id,
+            "tool_call_id": tool_call.tool_call_id,
+            "tool_name": tool_call.tool_name,
+            "input": tool_call.input,
+            "output": tool_call.output,
+            "error": tool_call.error,
+            "status": tool_call.status,
+            "started_at": _datetime_to_json(tool_call.started_at),
+            "completed_at": _datetime_to_json(completed_at) if completed_at is not None else None,
+        }
+
+
+def _datetime_to_json(value: datetime) -> str:
+    """Format a datetime the way Pydantic's JSON mode does (UTC offset as "Z")."""
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
 
 class ToolCallStartEvent(BaseModel):
     """SSE event data for tool_call_start."""
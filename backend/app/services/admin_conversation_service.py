@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import math
 
 from sqlalchemy.orm import Session
 
@@ -63,7 +62,7 @@ class AdminConversationService:
             end_date=end_date,
         )
 
-        total_pages = math.ceil(total / per_page) if total > 0 else 1
+        total_pages = ((total + per_page - 1) // per_page) or 1
 
         conversations = [
             AdminConversationResponse(
@@ -138,7 +137,7 @@ class AdminConversationService:
                 email=user.email,
                 name=user.name,
             ),
-            messages=[MessageResponse.model_validate(msg) for msg in conversation.messages],
+            messages=[MessageResponse.from_orm_fast(msg) for msg in conversation.messages],
             created_at=conversation.created_at,
             updated_at=conversation.updated_at,
         )
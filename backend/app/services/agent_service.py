@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import contextvars
+import functools
 import logging
+import queue
+import random
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Generator
+from dataclasses import dataclass, field
+from typing import Any, Generator, Iterable, Literal
 
 from anthropic import APIConnectionError, APIStatusError, RateLimitError
 from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
 from langgraph.prebuilt import create_react_agent
 
-from app.constants.agent import MAX_CONVERSATION_TITLE_LENGTH, TITLE_TRUNCATION_LENGTH, TITLE_TRUNCATION_SUFFIX
+from app.constants.agent import (
+    MAX_CONVERSATION_TITLE_LENGTH,
+    MAX_RETRY_DELAY,
+    RETRY_BACKOFF_MULTIPLIER,
+    STREAM_DELTA_COALESCE_SECONDS,
+    STREAM_PREFETCH_MAX_CHUNKS,
+    TITLE_TRUNCATION_LENGTH,
+    TITLE_TRUNCATION_SUFFIX,
+)
 from app.constants.error_types import LLMErrorType
 from app.constants.http import HTTP_BAD_REQUEST, HTTP_INTERNAL_SERVER_ERROR
 from app.constants.jwt import MS_PER_SECOND
@@ -27,7 +40,7 @@ When the user asks for calculations, use the appropriate tool (add, subtract, mu
 Please respond in the same language as the user."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCallEvent:
     """Event emitted when a tool is called."""
 
@@ -36,7 +49,7 @@ class ToolCallEvent:
     input: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResultEvent:
     """Event emitted when a tool returns a result."""
 
@@ -45,21 +58,21 @@ class ToolResultEvent:
     error: str | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextDeltaEvent:
     """Event emitted for text content."""
 
     delta: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageCompleteEvent:
     """Event emitted when agent response is complete."""
 
     content: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageMetadataEvent:
     """Event emitted with usage metadata after response completion."""
 
@@ -69,7 +82,7 @@ class MessageMetadataEvent:
     response_time_ms: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryEvent:
     """Event emitted when a retry is attempted."""
 
@@ -79,28 +92,146 @@ class RetryEvent:
     delay: float
 
 
-AgentEvent = ToolCallEvent | ToolResultEvent | TextDeltaEvent | MessageCompleteEvent | MessageMetadataEvent | RetryEvent
+@dataclass(slots=True, frozen=True)
+class StreamIdleEvent:
+    """Event emitted when the upstream stream stalls right after text deltas."""
 
 
-@dataclass
+# Shared completion event for turns that produced no text (events are immutable)
+_EMPTY_MESSAGE_COMPLETE = MessageCompleteEvent(content="")
+_STREAM_IDLE_EVENT = StreamIdleEvent()
+
+AgentEvent = ToolCallEvent | ToolResultEvent | TextDeltaEvent | MessageCompleteEvent | MessageMetadataEvent | RetryEvent | StreamIdleEvent
+
+
+@dataclass(slots=True)
 class _StreamState:
     """Internal state for response streaming.
 
     Tracks accumulated content, emitted tool calls, and usage metadata
-    during the streaming process.
+    during the streaming process. Text deltas are collected in content_parts
+    and joined once when the message completes. emitted_tool_calls is created
+    lazily on the first updates chunk, so plain chat turns never allocate it.
     """
 
-    full_content: str = ""
-    emitted_tool_calls: set[str] | None = None
+    content_parts: list[str] = field(default_factory=list)
+    emitted_tool_calls: dict[str, None] | None = None
     needs_newline_before_text: bool = False
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     start_time: float = 0.0
 
-    def __post_init__(self) -> None:
-        """Initialize mutable default values."""
-        if self.emitted_tool_calls is None:
-            self.emitted_tool_calls = set()
+
+# Markers passed through the prefetch queue alongside stream chunks
+_STREAM_END = object()
+_STREAM_IDLE = object()
+_PREFETCH_PUT_TIMEOUT = 0.1  # Seconds between cancellation checks while the queue is full
+
+
+@dataclass(slots=True, frozen=True)
+class _StreamFailure:
+    """Exception raised by the upstream stream, forwarded to the consumer."""
+
+    exc: BaseException
+
+
+def _prefetch_stream(
+    source: Iterable[Any],
+    maxsize: int = STREAM_PREFETCH_MAX_CHUNKS,
+    idle_timeout: float | None = None,
+) -> Generator[Any, None, None]:
+    """Yield items from source while a worker thread reads ahead into a bounded queue.
+
+    Upstream network reads overlap with the caller writing the previous chunk to
+    the client. The bounded queue applies back-pressure, upstream exceptions are
+    re-raised in the caller, and closing the generator stops the worker.
+
+    Args:
+        source: Iterable to read ahead (e.g. the agent stream)
+        maxsize: Maximum number of items buffered ahead of the caller
+        idle_timeout: If given, _STREAM_IDLE is yielded once whenever no item
+                      arrives for this many seconds (e.g. during a long tool call)
+
+    Yields:
+        Items of source in order
+    """
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+    cancelled = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not cancelled.is_set():
+            try:
+                buffer.put(item, timeout=_PREFETCH_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    return
+        except BaseException as exc:  # Forwarded to and re-raised by the consumer
+            put(_StreamFailure(exc))
+        else:
+            put(_STREAM_END)
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+
+    # Run in a copy of the caller's context so LangChain callbacks and config propagate
+    worker = threading.Thread(target=contextvars.copy_context().run, args=(produce,), name="agent-stream-prefetch", daemon=True)
+    worker.start()
+    try:
+        idle_reported = False
+        while True:
+            try:
+                item = buffer.get(timeout=None if idle_reported else idle_timeout)
+            except queue.Empty:
+                idle_reported = True
+                yield _STREAM_IDLE
+                continue
+            idle_reported = False
+            if item is _STREAM_END:
+                return
+            if isinstance(item, _StreamFailure):
+                raise item.exc
+            yield item
+    finally:
+        cancelled.set()
+
+
+# LangChain message class for each supported conversation role
+_ROLE_MESSAGE_CLASSES: dict[str, type[HumanMessage] | type[AIMessage]] = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
+
+def clear_agent_cache() -> None:
+    """Drop the process-wide shared AgentService so the next request builds a new one."""
+    get_shared_agent_service.cache_clear()
+
+
+def _truncate_title(text: str) -> str:
+    """Build a conversation title by truncating text.
+
+    Strips surrounding whitespace only when present, avoiding a copy of the
+    (possibly long) message in the common case.
+
+    Args:
+        text: Source text for the title
+
+    Returns:
+        Title of at most MAX_CONVERSATION_TITLE_LENGTH characters
+    """
+    if text and (text[0].isspace() or text[-1].isspace()):
+        text = text.strip()
+    if len(text) > MAX_CONVERSATION_TITLE_LENGTH:
+        return text[:TITLE_TRUNCATION_LENGTH] + TITLE_TRUNCATION_SUFFIX
+    return text
 
 
 class AgentService:
@@ -137,12 +268,12 @@ class AgentService:
         else:
             self._provider = create_provider()
 
-        self.llm = self._provider.create_chat_model()
-
         # Get tools from registry
         registry = tool_registry or get_tool_registry()
         self.tools = registry.get_all_tools()
 
+        self.llm = self._provider.create_chat_model()
+
         # Create ReAct agent graph
         self.agent = create_react_agent(
             self.llm,
@@ -150,6 +281,11 @@ class AgentService:
             prompt=self._system_prompt,
         )
 
+        # Stream modes:
+        # - "messages": token-by-token streaming from LLM
+        # - "updates": node completion events (tool calls/results), only needed when tools are bound
+        self._stream_modes: list[Literal["messages", "updates"]] = ["messages", "updates"] if self.tools else ["messages"]
+
         logger.info(f"AgentService initialized with {len(self.tools)} tools")
 
     @property
@@ -172,15 +308,9 @@ class AgentService:
         """Return max tokens."""
         return self._provider.config.max_tokens
 
-    def _convert_messages(self, messages: list[dict[str, str]]) -> list[HumanMessage | AIMessage]:
+    def _convert_messages(self, messages: Iterable[dict[str, str]]) -> list[HumanMessage | AIMessage]:
         """Convert simple message dicts to LangChain message objects."""
-        result: list[HumanMessage | AIMessage] = []
-        for msg in messages:
-            if msg["role"] == "user":
-                result.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                result.append(AIMessage(content=msg["content"]))
-        return result
+        return [_ROLE_MESSAGE_CLASSES[msg["role"]](content=msg["content"]) for msg in messages if msg["role"] in _ROLE_MESSAGE_CLASSES]
 
     def _extract_text_content(self, content: Any) -> str:
         """Extract text content from various message content formats.
@@ -203,24 +333,30 @@ class AgentService:
             return "".join(text_parts)
         return ""
 
-    def _handle_messages_stream(self, data: tuple[Any, Any]) -> str | None:
+    def _handle_messages_stream(
+        self,
+        message_chunk: Any,
+        metadata: Any,  # noqa: ARG002
+        *,
+        _isinstance: Any = isinstance,
+        _AIMessageChunk: type = AIMessageChunk,
+    ) -> str | None:
         """Handle messages stream mode chunk.
 
         Only processes AIMessageChunk instances to avoid including tool outputs
-        in the assistant's text response.
+        in the assistant's text response. The (message_chunk, metadata) pair is
+        unpacked once by the stream loop. Runs once per token, so the globals it
+        uses are bound as keyword-only defaults (fast locals instead of global lookups).
 
         Args:
-            data: Tuple of (message_chunk, metadata) from messages stream
+            message_chunk: Message chunk from messages stream
+            metadata: Stream metadata accompanying the chunk (unused)
 
         Returns:
             Extracted text content or None if no content or non-AI message
         """
-        if not isinstance(data, tuple) or len(data) != 2:
-            return None
-
-        message_chunk, _ = data
         # Filter to only process AI message chunks, ignoring ToolMessage and other types
-        if not isinstance(message_chunk, AIMessageChunk):
+        if not _isinstance(message_chunk, _AIMessageChunk):
             return None
         if hasattr(message_chunk, "content") and message_chunk.content:
             text_content = self._extract_text_content(message_chunk.content)
@@ -229,36 +365,40 @@ class AgentService:
 
     def _process_message_chunk(
         self,
-        data: tuple[Any, Any],
+        message_chunk: Any,
+        metadata: Any,
         state: _StreamState,
-    ) -> TextDeltaEvent | None:
+    ) -> Generator[TextDeltaEvent, None, None]:
         """Process a message stream chunk and update state.
 
         Extracts text content from the chunk, handles newline insertion after
-        tool results, and updates the accumulated content.
+        tool results, and updates the accumulated content. The newline is
+        emitted as its own delta rather than prepended to the text.
 
         Args:
-            data: Tuple of (message_chunk, metadata) from messages stream
+            message_chunk: Message chunk from messages stream
+            metadata: Stream metadata accompanying the chunk
             state: Current stream state (modified in place)
 
-        Returns:
-            TextDeltaEvent if text content was extracted, None otherwise
+        Yields:
+            TextDeltaEvent for the separating newline (if needed) and the extracted text
         """
-        text_content = self._handle_messages_stream(data)
+        text_content = self._handle_messages_stream(message_chunk, metadata)
         if not text_content:
-            return None
+            return
 
         # Add newline before text that follows tool result
         if state.needs_newline_before_text:
-            text_content = "\n" + text_content
             state.needs_newline_before_text = False
+            state.content_parts.append("\n")
+            yield TextDeltaEvent(delta="\n")
 
-        state.full_content += text_content
-        return TextDeltaEvent(delta=text_content)
+        state.content_parts.append(text_content)
+        yield TextDeltaEvent(delta=text_content)
 
     def _accumulate_usage_metadata(
         self,
-        data: tuple[Any, Any],
+        message_chunk: Any,
         state: _StreamState,
     ) -> None:
         """Accumulate usage metadata from message chunk.
@@ -267,13 +407,9 @@ class AgentService:
         metadata and adds them to the running totals in state.
 
         Args:
-            data: Tuple of (message_chunk, metadata) from messages stream
+            message_chunk: Message chunk from messages stream
             state: Current stream state (modified in place)
         """
-        if not isinstance(data, tuple) or len(data) != 2:
-            return
-
-        message_chunk, _ = data
         if not isinstance(message_chunk, AIMessageChunk):
             return
 
@@ -289,13 +425,13 @@ class AgentService:
     def _handle_updates_stream(
         self,
         data: dict[str, Any],
-        emitted_tool_calls: set[str],
+        emitted_tool_calls: dict[str, None],
     ) -> Generator[ToolCallEvent | ToolResultEvent, None, None]:
         """Handle updates stream mode chunk.
 
         Args:
             data: Dict containing node outputs
-            emitted_tool_calls: Set of already emitted tool call IDs (modified in place)
+            emitted_tool_calls: Already emitted tool call IDs as dict keys (modified in place)
 
         Yields:
             ToolCallEvent or ToolResultEvent instances
@@ -309,36 +445,53 @@ class AgentService:
     def _process_agent_node(
         self,
         node_output: dict[str, Any],
-        emitted_tool_calls: set[str],
+        emitted_tool_calls: dict[str, None],
+        *,
+        _getattr: Any = getattr,
+        _ToolCallEvent: type[ToolCallEvent] = ToolCallEvent,
     ) -> Generator[ToolCallEvent, None, None]:
         """Process agent node output for tool calls.
 
+        Globals used in the loop are bound as keyword-only defaults.
+
         Args:
             node_output: Output from agent node
-            emitted_tool_calls: Set of already emitted tool call IDs
+            emitted_tool_calls: Already emitted tool call IDs as dict keys (modified in place)
 
         Yields:
             ToolCallEvent for each new tool call
         """
         agent_messages = node_output.get("messages", [])
         for msg in agent_messages:
-            if hasattr(msg, "tool_calls") and msg.tool_calls:
-                for tool_call in msg.tool_calls:
-                    tool_call_id = tool_call["id"]
-                    if tool_call_id not in emitted_tool_calls:
-                        emitted_tool_calls.add(tool_call_id)
-                        yield ToolCallEvent(
-                            tool_call_id=tool_call_id,
-                            tool_name=tool_call["name"],
-                            input=tool_call["args"],
-                        )
+            tool_calls = _getattr(msg, "tool_calls", None)
+            if not tool_calls:
+                continue
+            for tool_call in tool_calls:
+                tool_call_id = tool_call["id"]
+                # The updates stream re-yields accumulated state, so most entries are already emitted
+                if tool_call_id in emitted_tool_calls:
+                    continue
+                emitted_tool_calls[tool_call_id] = None
+                yield _ToolCallEvent(
+                    tool_call_id=tool_call_id,
+                    tool_name=tool_call["name"],
+                    input=tool_call["args"],
+                )
 
     def _process_tools_node(
         self,
         node_output: dict[str, Any],
+        *,
+        _isinstance: Any = isinstance,
+        _getattr: Any = getattr,
+        _str: type[str] = str,
+        _ToolMessage: type = ToolMessage,
+        _ToolResultEvent: type[ToolResultEvent] = ToolResultEvent,
     ) -> Generator[ToolResultEvent, None, None]:
         """Process tools node output for results.
 
+        Globals used in the loop are bound as keyword-only defaults.
+
         Args:
             node_output: Output from tools node
 
@@ -347,19 +500,21 @@ class AgentService:
         """
         tool_messages = node_output.get("messages", [])
         for msg in tool_messages:
-            if isinstance(msg, ToolMessage):
-                error = None
-                output = str(msg.content) if msg.content else None
-
-                if hasattr(msg, "status") and msg.status == "error":
-                    error = output
-                    output = None
-
-                yield ToolResultEvent(
-                    tool_call_id=msg.tool_call_id,
-                    output=output,
-                    error=error,
-                )
+            if not _isinstance(msg, _ToolMessage):
+                continue
+            content = msg.content
+            # ToolMessage content is almost always already a str; only convert other payloads
+            if not content:
+                text = None
+            elif _isinstance(content, _str):
+                text = content
+            else:
+                text = _str(content)
+
+            if _getattr(msg, "status", None) == "error":
+                yield _ToolResultEvent(tool_call_id=msg.tool_call_id, output=None, error=text)
+            else:
+                yield _ToolResultEvent(tool_call_id=msg.tool_call_id, output=text, error=None)
 
     def _process_updates_chunk(
         self,
@@ -378,8 +533,8 @@ class AgentService:
         Yields:
             ToolCallEvent or ToolResultEvent instances
         """
-        # emitted_tool_calls is guaranteed to be non-None after __post_init__
-        assert state.emitted_tool_calls is not None
+        if state.emitted_tool_calls is None:
+            state.emitted_tool_calls = {}
         for event in self._handle_updates_stream(data, state.emitted_tool_calls):
             yield event
             # Set flag after tool result to add newline before next text
@@ -402,7 +557,8 @@ class AgentService:
         """
         response_time_ms = int((time.time() - state.start_time) * MS_PER_SECOND)
 
-        yield MessageCompleteEvent(content=state.full_content)
+        content_parts = state.content_parts
+        yield MessageCompleteEvent(content="".join(content_parts)) if content_parts else _EMPTY_MESSAGE_COMPLETE
         yield MessageMetadataEvent(
             input_tokens=state.total_input_tokens,
             output_tokens=state.total_output_tokens,
@@ -410,142 +566,238 @@ class AgentService:
             response_time_ms=response_time_ms,
         )
 
+    def _process_stream_chunk(
+        self,
+        chunk: Any,
+        state: _StreamState,
+    ) -> Generator[AgentEvent, None, None]:
+        """Process a single (stream_mode, data) chunk from the agent stream.
+
+        Shape is validated by unpacking; try/except costs nothing on the
+        well-formed path.
+
+        Args:
+            chunk: Tuple of (stream_mode, data) from the agent stream
+            state: Current stream state (modified in place)
+
+        Yields:
+            AgentEvent instances for tool calls, results, and text content
+        """
+        try:
+            stream_mode, data = chunk
+        except (TypeError, ValueError):
+            return
+
+        if stream_mode == "messages":
+            try:
+                message_chunk, metadata = data
+            except (TypeError, ValueError):
+                return
+            yield from self._process_message_chunk(message_chunk, metadata, state)
+            self._accumulate_usage_metadata(message_chunk, state)
+
+        elif stream_mode == "updates" and isinstance(data, dict):
+            yield from self._process_updates_chunk(data, state)
+
+    def _collect_agent_node_messages(
+        self,
+        data: dict[str, Any],
+        state: _StreamState,
+    ) -> None:
+        """Accumulate text and token usage from completed agent node messages.
+
+        Used when the agent runs without the "messages" stream mode, so each AI
+        message arrives once, whole, instead of as per-token chunks.
+
+        Args:
+            data: Dict containing node outputs from the updates stream
+            state: Current stream state (modified in place)
+        """
+        node_output = data.get("agent")
+        if not isinstance(node_output, dict):
+            return
+
+        for msg in node_output.get("messages", []):
+            if not isinstance(msg, AIMessage):
+                continue
+
+            text_content = self._extract_text_content(msg.content)
+            if text_content:
+                if state.needs_newline_before_text:
+                    state.needs_newline_before_text = False
+                    state.content_parts.append("\n")
+                state.content_parts.append(text_content)
+
+            usage_metadata = getattr(msg, "usage_metadata", None)
+            if usage_metadata:
+                state.total_input_tokens += usage_metadata.get("input_tokens", 0)
+                state.total_output_tokens += usage_metadata.get("output_tokens", 0)
+
     def _generate_response_attempt(
         self,
-        messages: list[dict[str, str]],
+        langchain_messages: list[HumanMessage | AIMessage],
+        stream: bool = True,
     ) -> Generator[AgentEvent, None, None]:
         """Single attempt to generate response.
 
         Args:
-            messages: Conversation history as list of dicts with 'role' and 'content'
+            langchain_messages: Conversation history converted to LangChain messages
+            stream: Whether to yield per-token TextDeltaEvents; when False the agent
+                    runs in "updates" mode only and the text arrives in MessageCompleteEvent
 
         Yields:
-            AgentEvent instances for tool calls, results, text content, and metadata
+            AgentEvent instances for tool calls, results, text content, and metadata,
+            plus a StreamIdleEvent when a streamed stall follows text deltas
         """
-        langchain_messages = self._convert_messages(messages)
         inputs = {"messages": langchain_messages}
         state = _StreamState(start_time=time.time())
 
-        # Stream with both modes:
-        # - "messages": token-by-token streaming from LLM
-        # - "updates": node completion events (tool calls/results)
-        for chunk in self.agent.stream(inputs, stream_mode=["messages", "updates"]):
-            if not isinstance(chunk, tuple) or len(chunk) != 2:
-                continue
+        if stream:
+            # Read ahead of the caller so upstream reads overlap with SSE writes, and report
+            # stalls so text held back by delta coalescing is not delayed by a slow upstream
+            stream = self.agent.stream(inputs, stream_mode=self._stream_modes)
+            after_text = False
+            for chunk in _prefetch_stream(stream, idle_timeout=STREAM_DELTA_COALESCE_SECONDS):
+                if chunk is _STREAM_IDLE:
+                    if after_text:
+                        after_text = False
+                        yield _STREAM_IDLE_EVENT
+                    continue
+                for event in self._process_stream_chunk(chunk, state):
+                    after_text = type(event) is TextDeltaEvent
+                    yield event
+        else:
+            for data in self.agent.stream(inputs, stream_mode="updates"):
+                if not isinstance(data, dict):
+                    continue
+                yield from self._process_updates_chunk(data, state)
+                self._collect_agent_node_messages(data, state)
 
-            stream_mode, data = chunk
+        yield from self._emit_completion_events(state)
 
-            if stream_mode == "messages":
-                text_event = self._process_message_chunk(data, state)
-                if text_event:
-                    yield text_event
-                self._accumulate_usage_metadata(data, state)
+    def _classify_attempt_error(
+        self,
+        exc: Exception,
+        attempt: int,
+        max_attempts: int,
+    ) -> tuple[str, str, float | None]:
+        """Classify a failed attempt, raising a domain error when it must not be retried.
 
-            elif stream_mode == "updates" and isinstance(data, dict):
-                yield from self._process_updates_chunk(data, state)
+        Args:
+            exc: Exception raised by the attempt
+            attempt: Current attempt number (1-indexed)
+            max_attempts: Total number of attempts allowed
 
-        yield from self._emit_completion_events(state)
+        Returns:
+            Tuple of (error_type, log reason, retry_after) for a retryable error
+
+        Raises:
+            LLMRateLimitError: If rate limit retries are exhausted
+            LLMConnectionError: If connection retries are exhausted
+            LLMContextLengthError: If the context length was exceeded
+            ProviderAPIKeyError: If the API key was rejected (401/403)
+            LLMStreamError: For non-retryable API errors or exhausted retries
+        """
+        is_last_attempt = attempt >= max_attempts
+
+        if isinstance(exc, RateLimitError):
+            retry_after = getattr(exc, "retry_after", None)
+            if is_last_attempt:
+                logger.error(f"Rate limit exceeded after {max_attempts} attempts")
+                raise LLMRateLimitError(retry_after=retry_after)
+            return LLMErrorType.RATE_LIMIT, "Rate limit hit", retry_after
+
+        if isinstance(exc, APIConnectionError):
+            if is_last_attempt:
+                logger.error(f"Connection error after {max_attempts} attempts: {exc}")
+                raise LLMConnectionError(str(exc))
+            return LLMErrorType.CONNECTION, "Connection error", None
+
+        if isinstance(exc, APIStatusError):
+            # Check for context length error (400 with specific message)
+            if exc.status_code == HTTP_BAD_REQUEST and "context_length" in str(exc).lower():
+                logger.error(f"Context length exceeded: {exc}")
+                raise LLMContextLengthError()
+
+            # Authentication/permission errors (401, 403) - API key issues
+            if exc.status_code in (401, 403):
+                logger.error(f"Authentication error ({exc.status_code}): {exc}")
+                raise ProviderAPIKeyError(provider=self.provider_name)
+
+            # Retry on server errors (500+)
+            if exc.status_code < HTTP_INTERNAL_SERVER_ERROR or is_last_attempt:
+                logger.error(f"API error ({exc.status_code}) after {attempt} attempts: {exc}")
+                raise LLMStreamError(str(exc), is_retryable=False)
+            return LLMErrorType.SERVER_ERROR, f"Server error ({exc.status_code})", None
+
+        # Generic error handling with retry for unknown errors
+        logger.error(f"Unexpected error in agent execution: {exc}")
+        if is_last_attempt:
+            raise LLMStreamError(str(exc))
+        return LLMErrorType.UNKNOWN, "Unexpected error", None
+
+    def _max_attempts(self) -> int:
+        """Return the total number of attempts (1 initial attempt + max_retries retries)."""
+        return self._provider.config.max_retries + 1
 
     def generate_response(
         self,
-        messages: list[dict[str, str]],
-        stream: bool = True,  # noqa: ARG002 - kept for API compatibility
+        messages: Iterable[dict[str, str]],
+        stream: bool = True,
     ) -> Generator[AgentEvent, None, None]:
         """
         Generate AI response using the ReAct agent with retry logic.
 
         Args:
-            messages: Conversation history as list of dicts with 'role' and 'content'
-            stream: Whether to stream the response (currently always True for agent)
+            messages: Conversation history as dicts with 'role' and 'content'. May be a
+                      one-shot iterator; it is consumed once, before the first attempt.
+            stream: Whether to yield per-token TextDeltaEvents. Non-streaming callers pass
+                    False to skip token chunks; tool, completion, and metadata events
+                    are yielded either way.
 
         Yields:
             AgentEvent instances for tool calls, results, text content, and retry events
         """
-        logger.debug(f"Generating agent response with {len(messages)} messages")
+        # Converted once so retries reuse the same LangChain messages
+        langchain_messages = self._convert_messages(messages)
+        logger.debug(f"Generating agent response with {len(langchain_messages)} messages")
 
-        # max_retries is the number of retries, so we need max_retries + 1 attempts
-        # (1 initial attempt + max_retries retry attempts)
-        max_retries = self._provider.config.max_retries
-        max_attempts = max_retries + 1
-        base_delay = self._provider.config.retry_delay
+        max_attempts = self._max_attempts()
+        prev_delay = self._provider.config.retry_delay
 
         for attempt in range(1, max_attempts + 1):
             try:
-                yield from self._generate_response_attempt(messages)
+                yield from self._generate_response_attempt(langchain_messages, stream)
                 return  # Success, exit retry loop
+            except Exception as e:
+                error_type, reason, retry_after = self._classify_attempt_error(e, attempt, max_attempts)
 
-            except RateLimitError as e:
-                retry_after = getattr(e, "retry_after", None)
-                if attempt < max_attempts:
-                    delay = retry_after or (base_delay * (2 ** (attempt - 1)))
-                    logger.warning(f"Rate limit hit, retrying (attempt {attempt}/{max_attempts}), delay={delay}s")
-                    yield RetryEvent(
-                        attempt=attempt,
-                        max_attempts=max_attempts,
-                        error_type=LLMErrorType.RATE_LIMIT,
-                        delay=delay,
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(f"Rate limit exceeded after {max_attempts} attempts")
-                    raise LLMRateLimitError(retry_after=retry_after)
-
-            except APIConnectionError as e:
-                if attempt < max_attempts:
-                    delay = base_delay * (2 ** (attempt - 1))
-                    logger.warning(f"Connection error, retrying (attempt {attempt}/{max_attempts}), delay={delay}s")
-                    yield RetryEvent(
-                        attempt=attempt,
-                        max_attempts=max_attempts,
-                        error_type=LLMErrorType.CONNECTION,
-                        delay=delay,
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(f"Connection error after {max_attempts} attempts: {e}")
-                    raise LLMConnectionError(str(e))
-
-            except APIStatusError as e:
-                # Check for context length error (400 with specific message)
-                if e.status_code == HTTP_BAD_REQUEST and "context_length" in str(e).lower():
-                    logger.error(f"Context length exceeded: {e}")
-                    raise LLMContextLengthError()
-
-                # Authentication/permission errors (401, 403) - API key issues
-                if e.status_code in (401, 403):
-                    logger.error(f"Authentication error ({e.status_code}): {e}")
-                    raise ProviderAPIKeyError(provider=self.provider_name)
-
-                # Retry on server errors (500+)
-                if e.status_code >= HTTP_INTERNAL_SERVER_ERROR and attempt < max_attempts:
-                    delay = base_delay * (2 ** (attempt - 1))
-                    logger.warning(f"Server error ({e.status_code}), retrying (attempt {attempt}/{max_attempts})")
-                    yield RetryEvent(
-                        attempt=attempt,
-                        max_attempts=max_attempts,
-                        error_type=LLMErrorType.SERVER_ERROR,
-                        delay=delay,
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(f"API error ({e.status_code}) after {attempt} attempts: {e}")
-                    raise LLMStreamError(str(e), is_retryable=False)
+            delay = retry_after or self._compute_backoff(prev_delay)
+            prev_delay = delay
+            logger.warning(f"{reason}, retrying (attempt {attempt}/{max_attempts}), delay={delay:.2f}s")
+            yield RetryEvent(
+                attempt=attempt,
+                max_attempts=max_attempts,
+                error_type=error_type,
+                delay=delay,
+            )
+            time.sleep(delay)
 
-            except Exception as e:
-                # Generic error handling with retry for unknown errors
-                logger.error(f"Unexpected error in agent execution: {e}")
-                if attempt < max_attempts:
-                    delay = base_delay * (2 ** (attempt - 1))
-                    logger.warning(f"Retrying after unexpected error (attempt {attempt}/{max_attempts})")
-                    yield RetryEvent(
-                        attempt=attempt,
-                        max_attempts=max_attempts,
-                        error_type=LLMErrorType.UNKNOWN,
-                        delay=delay,
-                    )
-                    time.sleep(delay)
-                else:
-                    raise LLMStreamError(str(e))
+    def _compute_backoff(self, prev_delay: float) -> float:
+        """Compute the next retry delay using decorrelated jitter.
+
+        Draws uniformly from [base_delay, prev_delay * 3], capped at MAX_RETRY_DELAY,
+        so concurrent clients don't retry in lockstep against the LLM endpoint.
+
+        Args:
+            prev_delay: Delay used for the previous retry (base_delay for the first retry)
+
+        Returns:
+            Delay in seconds before the next attempt
+        """
+        base_delay = self._provider.config.retry_delay
+        upper = max(base_delay, prev_delay * RETRY_BACKOFF_MULTIPLIER)
+        return min(MAX_RETRY_DELAY, random.uniform(base_delay, upper))
 
     def generate_title(self, first_message: str) -> str:
         """
@@ -557,15 +809,24 @@ class AgentService:
         Returns:
             Generated title (max MAX_CONVERSATION_TITLE_LENGTH characters)
         """
-        # Simple approach: truncate the first message
-        title = first_message.strip()
-        if len(title) > MAX_CONVERSATION_TITLE_LENGTH:
-            title = title[:TITLE_TRUNCATION_LENGTH] + TITLE_TRUNCATION_SUFFIX
-        return title
+        return _truncate_title(first_message)
+
+
+@functools.lru_cache(maxsize=1)
+def get_shared_agent_service() -> AgentService:
+    """Return the process-wide AgentService built from the environment provider.
+
+    The service holds no per-request state, so one instance (provider client,
+    tools, and compiled agent graph) is reused by every request. Callers look
+    this function up at call time, so tests can patch it where it is imported.
+    """
+    return AgentService()
 
 
 __all__ = [
     "AgentService",
+    "clear_agent_cache",
+    "get_shared_agent_service",
     "AgentEvent",
     "ToolCallEvent",
     "ToolResultEvent",
@@ -573,5 +834,6 @@ __all__ = [
     "MessageCompleteEvent",
     "MessageMetadataEvent",
     "RetryEvent",
+    "StreamIdleEvent",
     "SYSTEM_PROMPT",
 ]
@@ -0,0 +1,210 @@
+"""Cache service for Redis-backed response caching."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_cache_redis_url
+from app.constants.redis import CACHE_SOCKET_TIMEOUT, CACHE_VERSION_TTL
+
+logger = logging.getLogger(__name__)
+
+# Process-wide Redis client (None when caching is disabled); created on first use
+_cache_client: redis.Redis | None = None
+_cache_client_loaded = False
+
+
+def get_cache_client() -> redis.Redis | None:
+    """Return the shared Redis client for the response cache.
+
+    Returns:
+        Redis client if caching is enabled and configured, otherwise None
+    """
+    global _cache_client, _cache_client_loaded
+    if not _cache_client_loaded:
+        url = get_cache_redis_url()
+        if url:
+            _cache_client = redis.Redis.from_url(
+                url,
+                socket_connect_timeout=CACHE_SOCKET_TIMEOUT,
+                socket_timeout=CACHE_SOCKET_TIMEOUT,
+                decode_responses=True,
+            )
+            logger.info("Response cache enabled with Redis backend")
+        _cache_client_loaded = True
+    return _cache_client
+
+
+class CacheService:
+    """Read-through cache for serialized responses.
+
+    All operations are no-ops when caching is disabled, and Redis errors are
+    logged and treated as cache misses so the database remains the source of truth.
+    """
+
+    def __init__(self, client: redis.Redis | None = None):
+        """Initialize service with a Redis client.
+
+        Args:
+            client: Redis client. If None, uses the shared client (or disables caching).
+        """
+        self._client = client if client is not None else get_cache_client()
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether a cache backend is configured."""
+        return self._client is not None
+
+    def get(self, key: str) -> str | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss, when disabled, or on Redis errors
+        """
+        if self._client is None:
+            return None
+        try:
+            value = self._client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+        # The shared client decodes responses; an injected client may return bytes
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value if isinstance(value, str) else None
+
+    def get_version(self, key: str) -> int:
+        """
+        Get the current value of a version counter.
+
+        Callers embed the version in related cache keys, so bumping it
+        invalidates all of them at once without scanning the keyspace.
+
+        Args:
+            key: Version counter key
+
+        Returns:
+            Current version, or 0 if unset, when disabled, or on Redis errors
+        """
+        value = self.get(key)
+        return int(value) if value is not None and value.isdigit() else 0
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        """
+        Store a value with an expiry.
+
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Time to live in seconds
+        """
+        if self._client is None:
+            return
+        try:
+            self._client.set(key, value, ex=ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    def delete(self, *keys: str) -> None:
+        """
+        Delete cached values.
+
+        Args:
+            *keys: Cache keys to delete
+        """
+        if self._client is None or not keys:
+            return
+        try:
+            self._client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache delete failed for {keys}: {e}")
+
+    def bump_version(self, key: str) -> None:
+        """
+        Increment a version counter, orphaning keys built from the previous version.
+
+        Orphaned keys are never read again and expire with their own TTL.
+
+        Args:
+            key: Version counter key
+        """
+        if self._client is None:
+            return
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            pipeline.incr(key)
+            pipeline.expire(key, CACHE_VERSION_TTL)
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Cache version bump failed for {key}: {e}")
+
+    def invalidate_on_commit(
+        self,
+        session: Session,
+        keys: tuple[str, ...] = (),
+        version_keys: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Invalidate cached values once the session's transaction commits.
+
+        Deleting after the commit prevents a concurrent reader from re-caching
+        rows that are about to change. Pending invalidations are kept in
+        session.info and dropped on rollback, so no per-session listener is added.
+
+        Args:
+            session: Session whose commit triggers the invalidation
+            keys: Cache keys to delete
+            version_keys: Version counters to bump
+        """
+        if self._client is None:
+            return
+        pending = session.info.get(_PENDING_INVALIDATIONS_KEY)
+        if pending is None:
+            pending = session.info[_PENDING_INVALIDATIONS_KEY] = _PendingInvalidations(self)
+        pending.keys.update(keys)
+        pending.version_keys.update(version_keys)
+
+
+@dataclass(slots=True)
+class _PendingInvalidations:
+    """Cache invalidations waiting for their session's transaction to commit."""
+
+    cache_service: CacheService
+    keys: set[str] = field(default_factory=set)
+    version_keys: set[str] = field(default_factory=set)
+
+    def apply(self) -> None:
+        """Delete the pending keys and bump the pending version counters."""
+        self.cache_service.delete(*self.keys)
+        for version_key in self.version_keys:
+            self.cache_service.bump_version(version_key)
+
+
+# session.info key holding a session's _PendingInvalidations
+_PENDING_INVALIDATIONS_KEY = "cache_pending_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    """Apply a session's pending cache invalidations after it commits."""
+    pending = session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+    if pending is not None:
+        pending.apply()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    """Drop a session's pending cache invalidations after a rollback."""
+    session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+
+
+__all__ = ["CacheService", "get_cache_client"]
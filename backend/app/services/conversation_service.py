@@ -2,26 +2,44 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import logging
-import math
+import time
 from dataclasses import dataclass, field
-from typing import Generator, Literal
+from datetime import datetime
+from typing import Callable, Generator, Iterable, Iterator, Literal, Sequence
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.constants.agent import (
+    MESSAGE_HISTORY_MAX_CHARS,
+    MESSAGE_HISTORY_MAX_MESSAGES,
+    STREAM_DELTA_COALESCE_CHARS,
+    STREAM_DELTA_COALESCE_SECONDS,
+)
 from app.constants.pagination import DEFAULT_PER_PAGE, MAX_PER_PAGE, MIN_PER_PAGE
-from app.core.exceptions import ConversationAccessDeniedError, ConversationNotFoundError
+from app.constants.redis import (
+    CONVERSATION_DETAIL_CACHE_KEY_PREFIX,
+    CONVERSATION_DETAIL_CACHE_TTL,
+    CONVERSATION_LIST_CACHE_KEY_PREFIX,
+    CONVERSATION_LIST_CACHE_TTL,
+)
+from app.core.exceptions import ConversationAccessDeniedError, ConversationNotFoundError, InvalidConversationCursorError
 from app.models.conversation import Conversation
 from app.models.message import Message
-from app.repositories.conversation_repository import ConversationRepository
+from app.repositories.conversation_repository import ConversationHandle, ConversationRepository
 from app.repositories.message_repository import MessageRepository
 from app.repositories.tool_call_repository import ToolCallData, ToolCallRepository
 from app.schemas.conversation import (
+    ConversationCursorListResponse,
     ConversationDetailResponse,
     ConversationListResponse,
     ConversationResponse,
     ConversationWithCountResponse,
     CreateConversationResponse,
+    CursorPaginationMeta,
     MessageResponse,
     PaginationMeta,
     SendMessageResponse,
@@ -33,11 +51,14 @@ from app.services.agent_service import (
     MessageCompleteEvent,
     MessageMetadataEvent,
     RetryEvent,
+    StreamIdleEvent,
     TextDeltaEvent,
     ToolCallEvent,
     ToolResultEvent,
+    get_shared_agent_service,
 )
-from app.services.metadata_service import MetadataService, StreamingResult
+from app.services.cache_service import CacheService
+from app.services.metadata_service import MetadataService, StreamingResult, get_shared_metadata_service
 
 
 @dataclass
@@ -60,6 +81,38 @@ StreamingEvent = tuple[
     dict,
 ]
 
+# Handler for one agent event type: (event, tool_call_buffer) -> (streaming_event, text_delta)
+AgentEventHandler = Callable[..., tuple[StreamingEvent | None, str | None]]
+
+
+def _encode_list_cursor(updated_at: datetime, conversation_id: int) -> str:
+    """Encode the keyset position of a conversation as an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(f"{updated_at.isoformat()}|{conversation_id}".encode()).decode()
+
+
+def _decode_list_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by _encode_list_cursor.
+
+    Raises:
+        InvalidConversationCursorError: If the cursor is malformed
+    """
+    try:
+        updated_at, conversation_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(updated_at), int(conversation_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidConversationCursorError(cursor) from e
+
+
+def conversation_list_cache_version_key(user_id: int) -> str:
+    """Return the key of the counter that versions a user's cached listings."""
+    return f"{CONVERSATION_LIST_CACHE_KEY_PREFIX}:{user_id}:version"
+
+
+def conversation_detail_cache_key(user_id: int, uuid: str) -> str:
+    """Return the key of a user's cached conversation detail."""
+    return f"{CONVERSATION_DETAIL_CACHE_KEY_PREFIX}:{user_id}:{uuid}"
+
 
 class ConversationService:
     """Service for conversation operations."""
@@ -69,30 +122,42 @@ class ConversationService:
         session: Session,
         agent_service: AgentService | None = None,
         metadata_service: MetadataService | None = None,
+        cache_service: CacheService | None = None,
     ):
         """Initialize service with database session.
 
         Args:
             session: SQLAlchemy database session.
-            agent_service: Agent service instance. If None, creates lazily on first use.
-            metadata_service: Metadata service instance. If None, creates default instance.
+            agent_service: Agent service instance. If None, uses the shared instance on first use.
+            metadata_service: Metadata service instance. If None, uses the shared instance.
+            cache_service: Response cache. If None, uses the shared cache (disabled unless configured).
         """
         self.session = session
         self.conversation_repo = ConversationRepository(session)
         self.message_repo = MessageRepository(session)
         self.tool_call_repo = ToolCallRepository(session)
         self._agent_service: AgentService | None = agent_service
-        self.metadata_service = metadata_service or MetadataService()
+        self.metadata_service = metadata_service or get_shared_metadata_service()
+        self.cache_service = cache_service or CacheService()
+
+        # Agent event type -> handler; one dict lookup per event instead of an isinstance chain
+        self._event_handlers: dict[type, AgentEventHandler] = {
+            TextDeltaEvent: self._handle_text_delta_event,
+            ToolCallEvent: self._handle_tool_call_event,
+            ToolResultEvent: self._handle_tool_result_event,
+            MessageCompleteEvent: self._handle_message_complete_event,
+            RetryEvent: self._handle_retry_event,
+        }
 
     @property
     def agent_service(self) -> AgentService:
-        """Get agent service, creating it lazily if needed.
+        """Get agent service, falling back to the process-wide shared instance.
 
         Returns:
             AgentService instance.
         """
         if self._agent_service is None:
-            self._agent_service = AgentService()
+            self._agent_service = get_shared_agent_service()
         return self._agent_service
 
     def list_conversations(
@@ -116,34 +181,86 @@ class ConversationService:
         per_page = max(MIN_PER_PAGE, min(per_page, MAX_PER_PAGE))
         page = max(1, page)
 
+        cache_key = f"{self._list_cache_prefix(user_id)}:{page}:{per_page}"
+        cached = self.cache_service.get(cache_key)
+        if cached is not None:
+            return ConversationListResponse.model_validate_json(cached)
+
         conversations_with_count, total = self.conversation_repo.find_by_user_id_with_message_count(
             user_id=user_id,
             page=page,
             per_page=per_page,
         )
 
-        total_pages = math.ceil(total / per_page) if total > 0 else 1
+        total_pages = ((total + per_page - 1) // per_page) or 1
 
+        # Rows come straight from the database, so the response is built without validation
         conversations = [
-            ConversationWithCountResponse(
-                uuid=item["conversation"].uuid,
-                title=item["conversation"].title,
-                message_count=item["message_count"],
-                created_at=item["conversation"].created_at,
-                updated_at=item["conversation"].updated_at,
-            )
-            for item in conversations_with_count
+            ConversationWithCountResponse.from_orm_fast(conversation, message_count) for conversation, message_count in conversations_with_count
         ]
 
-        return ConversationListResponse(
+        response = ConversationListResponse.model_construct(
             conversations=conversations,
-            meta=PaginationMeta(
+            meta=PaginationMeta.model_construct(
                 total=total,
                 page=page,
                 per_page=per_page,
                 total_pages=total_pages,
             ),
         )
+        self.cache_service.set(cache_key, response.model_dump_json(), CONVERSATION_LIST_CACHE_TTL)
+        return response
+
+    def list_conversations_after(
+        self,
+        user_id: int,
+        cursor: str | None = None,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> ConversationCursorListResponse:
+        """
+        List conversations for a user with keyset (cursor) pagination.
+
+        Unlike list_conversations, pages cost the same at any depth and no total
+        is counted; clients follow meta.next_cursor while meta.has_more is true.
+
+        Args:
+            user_id: User ID
+            cursor: next_cursor from the previous page, or None for the first page
+            per_page: Items per page
+
+        Returns:
+            ConversationCursorListResponse with conversations and cursor meta
+
+        Raises:
+            InvalidConversationCursorError: If the cursor is malformed
+        """
+        per_page = max(MIN_PER_PAGE, min(per_page, MAX_PER_PAGE))
+        position = _decode_list_cursor(cursor) if cursor else None
+
+        cache_key = f"{self._list_cache_prefix(user_id)}:c:{cursor or ''}:{per_page}"
+        cached = self.cache_service.get(cache_key)
+        if cached is not None:
+            return ConversationCursorListResponse.model_validate_json(cached)
+
+        conversations_with_count, has_more = self.conversation_repo.find_by_user_id_with_message_count_after(
+            user_id=user_id,
+            cursor=position,
+            per_page=per_page,
+        )
+
+        next_cursor = None
+        if has_more:
+            last = conversations_with_count[-1][0]
+            next_cursor = _encode_list_cursor(last.updated_at, last.id)
+
+        response = ConversationCursorListResponse.model_construct(
+            conversations=[
+                ConversationWithCountResponse.from_orm_fast(conversation, message_count) for conversation, message_count in conversations_with_count
+            ],
+            meta=CursorPaginationMeta.model_construct(per_page=per_page, has_more=has_more, next_cursor=next_cursor),
+        )
+        self.cache_service.set(cache_key, response.model_dump_json(), CONVERSATION_LIST_CACHE_TTL)
+        return response
 
     def get_conversation(
         self,
@@ -164,12 +281,20 @@ class ConversationService:
             ConversationNotFoundError: If conversation not found
             ConversationAccessDeniedError: If user doesn't own the conversation
         """
+        # Keyed by owner so a cached detail is only ever served to that user
+        cache_key = conversation_detail_cache_key(user_id, uuid)
+        cached = self.cache_service.get(cache_key)
+        if cached is not None:
+            return ConversationDetailResponse.model_validate_json(cached)
+
         conversation = self.validate_conversation_access(uuid, user_id, with_messages=True)
 
-        return ConversationDetailResponse(
-            conversation=ConversationResponse.model_validate(conversation),
-            messages=[MessageResponse.model_validate(msg) for msg in conversation.messages],
+        response = ConversationDetailResponse(
+            conversation=ConversationResponse.from_orm_fast(conversation),
+            messages=[MessageResponse.from_orm_fast(msg) for msg in conversation.messages],
         )
+        self.cache_service.set(cache_key, response.model_dump_json(), CONVERSATION_DETAIL_CACHE_TTL)
+        return response
 
     def create_conversation(
         self,
@@ -202,11 +327,12 @@ class ConversationService:
             content=first_message,
         )
 
+        self._invalidate_conversation_cache(conversation)
         logger.info(f"Created conversation {conversation.uuid} for user {user_id}")
 
         return CreateConversationResponse(
-            conversation=ConversationResponse.model_validate(conversation),
-            message=MessageResponse.model_validate(message),
+            conversation=ConversationResponse.from_orm_fast(conversation),
+            message=MessageResponse.from_orm_fast(message, with_tool_calls=False),
         )
 
     def create_conversation_streaming(
@@ -238,22 +364,22 @@ class ConversationService:
             title=title,
         )
 
-        # Create first message
-        user_message = self.message_repo.create(
-            conversation_id=conversation.id,
-            role="user",
-            content=first_message,
-        )
-        # Flush to get IDs
-        self.session.flush()
+        # Create first message and assistant placeholder (updated after streaming) in one flush
+        user_message, assistant_message = self.message_repo.create_exchange(conversation.id, first_message)
 
+        self._invalidate_conversation_cache(conversation)
         logger.info(f"Created conversation {conversation.uuid} for user {user_id}")
 
-        # Yield conversation created event
+        # Yield conversation created event (built directly in ConversationResponse's JSON shape)
         yield (
             "created",
             {
-                "conversation": ConversationResponse.model_validate(conversation).model_dump(mode="json"),
+                "conversation": {
+                    "uuid": conversation.uuid,
+                    "title": conversation.title,
+                    "created_at": conversation.created_at.isoformat(),
+                    "updated_at": conversation.updated_at.isoformat(),
+                },
                 "user_message_id": user_message.id,
             },
         )
@@ -261,18 +387,11 @@ class ConversationService:
         # Build message history for AI (just the first message)
         messages = [{"role": "user", "content": first_message}]
 
-        # Create placeholder for assistant message (will be updated after streaming)
-        assistant_message = self.message_repo.create(
-            conversation_id=conversation.id,
-            role="assistant",
-            content="",
-        )
-        self.session.flush()
-
         # Generate and stream AI response using common method
-        # Tool call buffer is passed to allow persistence on abort
+        # Tool call and content buffers are passed to allow persistence on abort
         tool_call_buffer: dict[str, ToolCallData] = {}
-        response_generator = self._stream_agent_response(messages, tool_call_buffer)
+        content_buffer: list[str] = []
+        response_generator = self._stream_agent_response(messages, tool_call_buffer, content_buffer)
         result: AgentStreamingResult | None = None
         streaming_completed = False
         try:
@@ -293,19 +412,20 @@ class ConversationService:
 
             logger.info(f"Streaming conversation created: {conversation.uuid}")
         finally:
-            # Persist buffered tool calls if streaming was interrupted
+            # Stage buffered tool calls if streaming was interrupted; the request
+            # teardown commit inserts them after the connection has been released
             if not streaming_completed and tool_call_buffer:
                 try:
-                    self.tool_call_repo.create_batch(
+                    self.tool_call_repo.add_batch(
                         message_id=assistant_message.id,
                         tool_calls=list(tool_call_buffer.values()),
                     )
-                    self.session.flush()
-                    logger.warning(
-                        f"Persisted {len(tool_call_buffer)} tool calls after streaming interruption " f"in conversation {conversation.uuid}"
-                    )
+                    logger.warning(f"Staged {len(tool_call_buffer)} tool calls after streaming interruption " f"in conversation {conversation.uuid}")
                 except Exception as e:
-                    logger.error(f"Failed to persist tool calls after streaming interruption: {e}")
+                    logger.error(f"Failed to stage tool calls after streaming interruption: {e}")
+            # Keep the text already sent to the client; written once by the same teardown commit
+            if not streaming_completed and content_buffer:
+                assistant_message.content = "".join(content_buffer)
 
     def delete_conversation(
         self,
@@ -325,9 +445,36 @@ class ConversationService:
         """
         conversation = self.validate_conversation_access(uuid, user_id)
 
+        self._invalidate_conversation_cache(conversation)
         self.conversation_repo.delete(conversation)
         logger.info(f"Deleted conversation {uuid}")
 
+    def _invalidate_conversation_cache(self, conversation: Conversation | ConversationHandle) -> None:
+        """
+        Invalidate the owner's cached listings and the conversation detail on commit.
+
+        Args:
+            conversation: Conversation being created, modified, or deleted
+        """
+        self.cache_service.invalidate_on_commit(
+            self.session,
+            keys=(conversation_detail_cache_key(conversation.user_id, conversation.uuid),),
+            version_keys=(conversation_list_cache_version_key(conversation.user_id),),
+        )
+
+    def _list_cache_prefix(self, user_id: int) -> str:
+        """
+        Build the key prefix for a user's cached listings at the current version.
+
+        Args:
+            user_id: Owner of the listings
+
+        Returns:
+            Prefix shared by every listing key of this user and version
+        """
+        version = self.cache_service.get_version(conversation_list_cache_version_key(user_id))
+        return f"{CONVERSATION_LIST_CACHE_KEY_PREFIX}:{user_id}:v{version}"
+
     def validate_conversation_access(
         self,
         uuid: str,
@@ -341,7 +488,7 @@ class ConversationService:
         Args:
             uuid: Conversation UUID
             user_id: User ID
-            with_messages: If True, load messages with the conversation
+            with_messages: If True, load messages (and their tool calls) with the conversation
 
         Returns:
             The validated conversation
@@ -350,11 +497,48 @@ class ConversationService:
             ConversationNotFoundError: If conversation not found
             ConversationAccessDeniedError: If user doesn't own the conversation
         """
+        # The owner filter is part of the query, so another user's conversation
+        # (and its messages) is never loaded
         if with_messages:
-            conversation = self.conversation_repo.find_by_uuid_with_messages(uuid)
+            conversation = self.conversation_repo.find_by_uuid_with_messages(uuid, user_id=user_id)
         else:
-            conversation = self.conversation_repo.find_by_uuid(uuid)
+            conversation = self.conversation_repo.find_by_uuid(uuid, user_id=user_id)
+
+        if conversation is None:
+            if self.conversation_repo.exists_by_uuid(uuid):
+                raise ConversationAccessDeniedError(uuid)
+            raise ConversationNotFoundError(uuid)
+
+        return conversation
+
+    def validate_conversation_handle(
+        self,
+        uuid: str,
+        user_id: int,
+    ) -> ConversationHandle:
+        """
+        Validate access like validate_conversation_access, loading only id, owner, and UUID.
 
+        Args:
+            uuid: Conversation UUID
+            user_id: User ID
+
+        Returns:
+            Handle of the validated conversation
+
+        Raises:
+            ConversationNotFoundError: If conversation not found
+            ConversationAccessDeniedError: If user doesn't own the conversation
+        """
+        return self._check_conversation_owner(self.conversation_repo.find_handle_by_uuid(uuid), uuid, user_id)
+
+    @staticmethod
+    def _check_conversation_owner(
+        conversation: ConversationHandle | None,
+        uuid: str,
+        user_id: int,
+    ) -> ConversationHandle:
+        """Raise unless the conversation exists and belongs to the user."""
         if not conversation:
             raise ConversationNotFoundError(uuid)
 
@@ -384,30 +568,21 @@ class ConversationService:
             ConversationNotFoundError: If conversation not found
             ConversationAccessDeniedError: If user doesn't own the conversation
         """
-        conversation = self.validate_conversation_access(uuid, user_id, with_messages=True)
+        conversation = self.validate_conversation_handle(uuid, user_id)
+        self._invalidate_conversation_cache(conversation)
 
-        # Save user message
-        user_message = self.message_repo.create(
-            conversation_id=conversation.id,
-            role="user",
-            content=content,
-        )
+        # Save user message and assistant message placeholder in one flush
+        user_message, assistant_message = self.message_repo.create_exchange(conversation.id, content)
 
-        # Build message history for AI
-        messages = self._build_message_history(conversation.messages, content)
-
-        # Create assistant message placeholder
-        assistant_message = self.message_repo.create(
-            conversation_id=conversation.id,
-            role="assistant",
-            content="",
-        )
-        self.session.flush()
+        # Build message history for AI from the newest messages before this exchange
+        history = self.message_repo.find_recent_role_content_pairs(conversation.id, MESSAGE_HISTORY_MAX_MESSAGES, before_id=user_message.id)
+        messages = self._iter_message_history(history, content)
 
         # Generate AI response using agent with common event processing
-        # Consume streaming generator to get result with metadata (don't yield events)
+        # No events are forwarded here, so the agent skips per-token chunks and the
+        # generator only steps on tool events before returning the result
         tool_call_buffer: dict[str, ToolCallData] = {}
-        response_generator = self._stream_agent_response(messages, tool_call_buffer)
+        response_generator = self._stream_agent_response(messages, tool_call_buffer, stream=False)
         result: AgentStreamingResult | None = None
         try:
             while True:
@@ -420,10 +595,12 @@ class ConversationService:
             result = AgentStreamingResult(streaming_result=empty_streaming_result)
 
         # Batch insert tool calls and update assistant message
-        self.tool_call_repo.create_batch(
+        created_tool_calls = self.tool_call_repo.create_batch(
             message_id=assistant_message.id,
             tool_calls=result.tool_calls,
         )
+        # The inserted rows are the whole collection, so the response never lazy-loads it
+        set_committed_value(assistant_message, "tool_calls", created_tool_calls)
         self.metadata_service.apply_streaming_result_to_message(assistant_message, result.streaming_result)
 
         # Update conversation timestamp
@@ -435,8 +612,8 @@ class ConversationService:
         logger.info(f"Message exchange in conversation {uuid}")
 
         return SendMessageResponse(
-            user_message=MessageResponse.model_validate(user_message),
-            assistant_message=MessageResponse.model_validate(assistant_message),
+            user_message=MessageResponse.from_orm_fast(user_message, with_tool_calls=False),
+            assistant_message=MessageResponse.from_orm_fast(assistant_message),
         )
 
     def send_message_streaming(
@@ -465,35 +642,24 @@ class ConversationService:
             ConversationNotFoundError: If conversation not found
             ConversationAccessDeniedError: If user doesn't own the conversation
         """
-        conversation = self.validate_conversation_access(uuid, user_id, with_messages=True)
+        conversation = self.validate_conversation_handle(uuid, user_id)
+        self._invalidate_conversation_cache(conversation)
 
-        # Save user message
-        user_message = self.message_repo.create(
-            conversation_id=conversation.id,
-            role="user",
-            content=content,
-        )
-        # Flush to get message ID
-        self.session.flush()
+        # Save user message and assistant placeholder (updated after streaming) in one flush
+        user_message, assistant_message = self.message_repo.create_exchange(conversation.id, content)
 
-        # Build message history for AI
-        messages = self._build_message_history(conversation.messages, content)
+        # Build message history for AI from the newest messages before this exchange
+        history = self.message_repo.find_recent_role_content_pairs(conversation.id, MESSAGE_HISTORY_MAX_MESSAGES, before_id=user_message.id)
+        messages = self._iter_message_history(history, content)
 
         # Yield start event
         yield ("start", {"user_message_id": user_message.id})
 
-        # Create placeholder for assistant message (will be updated after streaming)
-        assistant_message = self.message_repo.create(
-            conversation_id=conversation.id,
-            role="assistant",
-            content="",
-        )
-        self.session.flush()
-
         # Generate and stream AI response using common method
-        # Tool call buffer is passed to allow persistence on abort
+        # Tool call and content buffers are passed to allow persistence on abort
         tool_call_buffer: dict[str, ToolCallData] = {}
-        response_generator = self._stream_agent_response(messages, tool_call_buffer)
+        content_buffer: list[str] = []
+        response_generator = self._stream_agent_response(messages, tool_call_buffer, content_buffer)
         result: AgentStreamingResult | None = None
         streaming_completed = False
         try:
@@ -514,22 +680,25 @@ class ConversationService:
 
             logger.info(f"Streaming message exchange in conversation {uuid}")
         finally:
-            # Persist buffered tool calls if streaming was interrupted
+            # Stage buffered tool calls if streaming was interrupted; the request
+            # teardown commit inserts them after the connection has been released
             if not streaming_completed and tool_call_buffer:
                 try:
-                    self.tool_call_repo.create_batch(
+                    self.tool_call_repo.add_batch(
                         message_id=assistant_message.id,
                         tool_calls=list(tool_call_buffer.values()),
                     )
-                    self.session.flush()
-                    logger.warning(f"Persisted {len(tool_call_buffer)} tool calls after streaming interruption " f"in conversation {uuid}")
+                    logger.warning(f"Staged {len(tool_call_buffer)} tool calls after streaming interruption " f"in conversation {uuid}")
                 except Exception as e:
-                    logger.error(f"Failed to persist tool calls after streaming interruption: {e}")
+                    logger.error(f"Failed to stage tool calls after streaming interruption: {e}")
+            # Keep the text already sent to the client; written once by the same teardown commit
+            if not streaming_completed and content_buffer:
+                assistant_message.content = "".join(content_buffer)
 
     def _finalize_streaming_response(
         self,
         assistant_message: Message,
-        conversation: Conversation,
+        conversation: Conversation | ConversationHandle,
         result: AgentStreamingResult,
     ) -> dict:
         """
@@ -566,7 +735,7 @@ class ConversationService:
         self.session.flush()
 
         # Convert created tool calls to response format
-        tool_calls_data = [ToolCallResponse.model_validate(tc).model_dump(mode="json") for tc in created_tool_calls]
+        tool_calls_data = [ToolCallResponse.dump_orm_json(tc) for tc in created_tool_calls]
 
         # Get metadata as nullable dict
         metadata_dict = self.metadata_service.to_response_dict(result.streaming_result)
@@ -587,41 +756,41 @@ class ConversationService:
             "cost_usd": metadata_dict["cost_usd"],
         }
 
-    def _build_message_history(
+    def _iter_message_history(
         self,
-        existing_messages: list[Message],
+        history: Sequence[tuple[str, str]],
         new_content: str,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """
-        Build message history for AI API call.
+        Iterate over the message history for the AI API call.
+
+        Only the newest messages whose contents fit in MESSAGE_HISTORY_MAX_CHARS
+        are sent, so the model input stays bounded however long the conversation
+        grows. The window always opens on a user message, as the model expects.
 
         Args:
-            existing_messages: Existing messages in conversation
-            new_content: New user message content
+            history: Existing (role, content) pairs in conversation order
+            new_content: New user message content (always sent, outside the budget)
 
-        Returns:
-            List of message dicts for AI API
+        Yields:
+            Message dicts for AI API, ending with the new user message
         """
-        messages = []
-
-        # Add existing messages
-        for msg in existing_messages:
-            messages.append(
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                }
-            )
+        start = len(history)
+        budget = MESSAGE_HISTORY_MAX_CHARS
+        while start > 0:
+            budget -= len(history[start - 1][1])
+            if budget < 0:
+                break
+            start -= 1
+        while start < len(history) and history[start][0] != "user":
+            start += 1
+
+        for index in range(start, len(history)):
+            role, content = history[index]
+            yield {"role": role, "content": content}
 
         # Add new user message
-        messages.append(
-            {
-                "role": "user",
-                "content": new_content,
-            }
-        )
-
-        return messages
+        yield {"role": "user", "content": new_content}
 
     def _process_agent_event(
         self,
@@ -645,65 +814,101 @@ class ConversationService:
             - streaming_event: Event tuple to yield, or None if no event to emit
             - text_delta: Text content from the event, or None
         """
-        if isinstance(event, ToolCallEvent):
-            # Buffer tool call data instead of writing to DB
-            tool_call_buffer[event.tool_call_id] = ToolCallData(
-                tool_call_id=event.tool_call_id,
-                tool_name=event.tool_name,
-                input_data=event.input,
-            )
-            return (
-                (
-                    "tool_call_start",
-                    {
-                        "tool_call_id": event.tool_call_id,
-                        "tool_name": event.tool_name,
-                        "input": event.input,
-                    },
-                ),
-                None,
-            )
-        elif isinstance(event, ToolResultEvent):
-            # Update buffered tool call with result
-            if event.tool_call_id in tool_call_buffer:
-                tool_call_buffer[event.tool_call_id].complete(
-                    output=event.output,
-                    error=event.error,
-                )
-            return (
-                (
-                    "tool_call_end",
-                    {
-                        "tool_call_id": event.tool_call_id,
-                        "output": event.output,
-                        "error": event.error,
-                    },
-                ),
-                None,
-            )
-        elif isinstance(event, TextDeltaEvent):
-            return (("delta", {"delta": event.delta}), event.delta)
-        elif isinstance(event, MessageCompleteEvent):
-            return (None, event.content)
-        elif isinstance(event, RetryEvent):
-            return (
-                (
-                    "retry",
-                    {
-                        "attempt": event.attempt,
-                        "max_attempts": event.max_attempts,
-                        "error_type": event.error_type,
-                        "delay": event.delay,
-                    },
-                ),
-                None,
+        handler = self._event_handlers.get(type(event))
+        if handler is None:
+            return (None, None)
+        return handler(event, tool_call_buffer)
+
+    def _handle_tool_call_event(
+        self,
+        event: ToolCallEvent,
+        tool_call_buffer: dict[str, ToolCallData],
+    ) -> tuple[StreamingEvent | None, str | None]:
+        """Buffer a started tool call and build its tool_call_start event."""
+        # Buffer tool call data instead of writing to DB
+        tool_call_buffer[event.tool_call_id] = ToolCallData(
+            tool_call_id=event.tool_call_id,
+            tool_name=event.tool_name,
+            input_data=event.input,
+        )
+        return (
+            (
+                "tool_call_start",
+                {
+                    "tool_call_id": event.tool_call_id,
+                    "tool_name": event.tool_name,
+                    "input": event.input,
+                },
+            ),
+            None,
+        )
+
+    def _handle_tool_result_event(
+        self,
+        event: ToolResultEvent,
+        tool_call_buffer: dict[str, ToolCallData],
+    ) -> tuple[StreamingEvent | None, str | None]:
+        """Complete the buffered tool call and build its tool_call_end event."""
+        # Update buffered tool call with result
+        if event.tool_call_id in tool_call_buffer:
+            tool_call_buffer[event.tool_call_id].complete(
+                output=event.output,
+                error=event.error,
             )
-        return (None, None)
+        return (
+            (
+                "tool_call_end",
+                {
+                    "tool_call_id": event.tool_call_id,
+                    "output": event.output,
+                    "error": event.error,
+                },
+            ),
+            None,
+        )
+
+    def _handle_text_delta_event(
+        self,
+        event: TextDeltaEvent,
+        tool_call_buffer: dict[str, ToolCallData],  # noqa: ARG002
+    ) -> tuple[StreamingEvent | None, str | None]:
+        """Build a delta event for streamed text."""
+        return (("delta", {"delta": event.delta}), event.delta)
+
+    def _handle_message_complete_event(
+        self,
+        event: MessageCompleteEvent,
+        tool_call_buffer: dict[str, ToolCallData],  # noqa: ARG002
+    ) -> tuple[StreamingEvent | None, str | None]:
+        """Return the final content without emitting an event."""
+        return (None, event.content)
+
+    def _handle_retry_event(
+        self,
+        event: RetryEvent,
+        tool_call_buffer: dict[str, ToolCallData],  # noqa: ARG002
+    ) -> tuple[StreamingEvent | None, str | None]:
+        """Build a retry event for the client."""
+        return (
+            (
+                "retry",
+                {
+                    "attempt": event.attempt,
+                    "max_attempts": event.max_attempts,
+                    "error_type": event.error_type,
+                    "delay": event.delay,
+                },
+            ),
+            None,
+        )
 
     def _stream_agent_response(
         self,
-        messages: list[dict],
+        messages: Iterable[dict],
         tool_call_buffer: dict[str, ToolCallData],
+        content_buffer: list[str] | None = None,
+        *,
+        stream: bool = True,
     ) -> Generator[StreamingEvent, None, AgentStreamingResult]:
         """
         Stream agent response, yielding events and returning result with metadata.
@@ -718,33 +923,69 @@ class ConversationService:
             tool_call_buffer: Dictionary to store tool calls (modified in place).
                              Callers should provide an empty dict and can use it
                              in a finally block to persist partial results on abort.
+            content_buffer: List to collect text content (modified in place). Callers
+                            can join it in a finally block to persist partial text on abort.
+            stream: Whether the agent yields per-token text deltas. Callers that only
+                    need the final result pass False to skip token chunks entirely.
 
         Yields:
-            StreamingEvent tuples for tool calls and text deltas
+            StreamingEvent tuples for tool calls and text deltas (token bursts coalesced)
 
         Returns:
             AgentStreamingResult with content, metadata, and buffered tool calls
         """
-        full_response = ""
+        # Deltas are collected and joined once; the complete event's content replaces them
+        content_parts = content_buffer if content_buffer is not None else []
         metadata_event: MessageMetadataEvent | None = None
-
-        for event in self.agent_service.generate_response(messages, stream=True):
+        # Token bursts are sent as one delta event; any other event flushes them first.
+        # The first delta goes out at once so time to first token is unchanged, and the
+        # agent's StreamIdleEvent bounds how long text is held when upstream stalls.
+        pending_deltas: list[str] = []
+        pending_chars = 0
+        last_delta_sent = float("-inf")
+
+        for event in self.agent_service.generate_response(messages, stream=stream):
+            if type(event) is StreamIdleEvent:
+                # Upstream stalled (e.g. a long tool call), so held text is sent instead of waiting
+                if pending_deltas:
+                    yield ("delta", {"delta": "".join(pending_deltas)})
+                    pending_deltas.clear()
+                    pending_chars = 0
+                    last_delta_sent = time.monotonic()
+                continue
             streaming_event, text_content = self._process_agent_event(event, tool_call_buffer)
             if streaming_event is not None:
-                yield streaming_event
+                if type(event) is TextDeltaEvent:
+                    pending_deltas.append(event.delta)
+                    pending_chars += len(event.delta)
+                    now = time.monotonic()
+                    if pending_chars >= STREAM_DELTA_COALESCE_CHARS or now - last_delta_sent >= STREAM_DELTA_COALESCE_SECONDS:
+                        yield ("delta", {"delta": "".join(pending_deltas)})
+                        pending_deltas.clear()
+                        pending_chars = 0
+                        last_delta_sent = now
+                else:
+                    if pending_deltas:
+                        yield ("delta", {"delta": "".join(pending_deltas)})
+                        pending_deltas.clear()
+                        pending_chars = 0
+                        last_delta_sent = time.monotonic()
+                    yield streaming_event
             if text_content is not None:
-                if isinstance(event, TextDeltaEvent):
-                    full_response += text_content
-                elif isinstance(event, MessageCompleteEvent):
-                    full_response = text_content
-
-            # Capture metadata event
-            if isinstance(event, MessageMetadataEvent):
+                if type(event) is MessageCompleteEvent:
+                    content_parts[:] = [text_content]
+                else:
+                    content_parts.append(text_content)
+            elif isinstance(event, MessageMetadataEvent):
+                # Capture metadata event
                 metadata_event = event
 
+        if pending_deltas:
+            yield ("delta", {"delta": "".join(pending_deltas)})
+
         # Build streaming result with metadata using MetadataService
         streaming_result = self.metadata_service.build_streaming_result(
-            content=full_response,
+            content="".join(content_parts),
             event=metadata_event,
         )
 
@@ -755,4 +996,4 @@ class ConversationService:
         )
 
 
-__all__ = ["ConversationService"]
+__all__ = ["ConversationService", "conversation_detail_cache_key", "conversation_list_cache_version_key"]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING
 
 from app.services.agent_service import MessageMetadataEvent
 from app.utils.cost_calculator import calculate_cost
@@ -14,11 +15,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar("T", int, float, str)
-
-# Metadata field names that can be applied to Message model
-METADATA_FIELDS = ("input_tokens", "output_tokens", "model", "response_time_ms", "cost_usd")
-
 # Default/empty values for metadata fields
 DEFAULT_TOKEN_COUNT = 0
 DEFAULT_RESPONSE_TIME_MS = 0
@@ -29,20 +25,7 @@ DEFAULT_MODEL = ""
 EMPTY_THRESHOLD = 0
 
 
-def _to_nullable(value: T, is_empty: bool) -> T | None:
-    """Convert value to None if it represents an empty/zero value.
-
-    Args:
-        value: The value to convert
-        is_empty: Whether the value should be treated as empty
-
-    Returns:
-        None if is_empty is True, otherwise the original value
-    """
-    return None if is_empty else value
-
-
-@dataclass
+@dataclass(slots=True)
 class StreamingResult:
     """Result from streaming agent response with metadata."""
 
@@ -53,18 +36,8 @@ class StreamingResult:
     response_time_ms: int
     cost_usd: float
 
-    def to_metadata(self) -> MessageMetadata:
-        """Convert to MessageMetadata instance."""
-        return MessageMetadata(
-            input_tokens=self.input_tokens,
-            output_tokens=self.output_tokens,
-            model=self.model,
-            response_time_ms=self.response_time_ms,
-            cost_usd=self.cost_usd,
-        )
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MessageMetadata:
     """Message metadata container (data-only, no business logic)."""
 
@@ -76,14 +49,18 @@ class MessageMetadata:
 
     @classmethod
     def empty(cls) -> MessageMetadata:
-        """Create an empty metadata instance."""
-        return cls(
-            input_tokens=DEFAULT_TOKEN_COUNT,
-            output_tokens=DEFAULT_TOKEN_COUNT,
-            model=DEFAULT_MODEL,
-            response_time_ms=DEFAULT_RESPONSE_TIME_MS,
-            cost_usd=DEFAULT_COST_USD,
-        )
+        """Return the shared empty metadata instance."""
+        return _EMPTY_METADATA
+
+
+# Instances are immutable, so every empty result shares one
+_EMPTY_METADATA = MessageMetadata(
+    input_tokens=DEFAULT_TOKEN_COUNT,
+    output_tokens=DEFAULT_TOKEN_COUNT,
+    model=DEFAULT_MODEL,
+    response_time_ms=DEFAULT_RESPONSE_TIME_MS,
+    cost_usd=DEFAULT_COST_USD,
+)
 
 
 class MetadataService:
@@ -115,24 +92,28 @@ class MetadataService:
             or bool(metadata.model)
         )
 
-    def to_nullable_dict(self, metadata: MessageMetadata) -> dict:
+    def to_nullable_dict(self, metadata: MessageMetadata | StreamingResult) -> dict:
         """Convert metadata to dict with None for zero/empty values.
 
         This is used for both API responses and database storage,
         where we want to avoid storing meaningless zero values.
 
         Args:
-            metadata: MessageMetadata to convert
+            metadata: MessageMetadata, or a StreamingResult read directly for its metadata fields
 
         Returns:
             Dict with metadata fields, using None for zero/empty values
         """
+        input_tokens = metadata.input_tokens
+        output_tokens = metadata.output_tokens
+        response_time_ms = metadata.response_time_ms
+        cost_usd = metadata.cost_usd
         return {
-            "input_tokens": _to_nullable(metadata.input_tokens, metadata.input_tokens <= EMPTY_THRESHOLD),
-            "output_tokens": _to_nullable(metadata.output_tokens, metadata.output_tokens <= EMPTY_THRESHOLD),
-            "model": _to_nullable(metadata.model, not metadata.model),
-            "response_time_ms": _to_nullable(metadata.response_time_ms, metadata.response_time_ms <= EMPTY_THRESHOLD),
-            "cost_usd": _to_nullable(metadata.cost_usd, metadata.cost_usd <= EMPTY_THRESHOLD),
+            "input_tokens": input_tokens if input_tokens > EMPTY_THRESHOLD else None,
+            "output_tokens": output_tokens if output_tokens > EMPTY_THRESHOLD else None,
+            "model": metadata.model or None,
+            "response_time_ms": response_time_ms if response_time_ms > EMPTY_THRESHOLD else None,
+            "cost_usd": cost_usd if cost_usd > EMPTY_THRESHOLD else None,
         }
 
     def build_from_event(self, event: MessageMetadataEvent | None) -> MessageMetadata:
@@ -150,27 +131,32 @@ class MetadataService:
         if event is None:
             return MessageMetadata.empty()
 
-        # Validate non-negative values
-        if event.input_tokens < EMPTY_THRESHOLD:
-            raise ValueError(f"input_tokens cannot be negative: {event.input_tokens}")
-        if event.output_tokens < EMPTY_THRESHOLD:
-            raise ValueError(f"output_tokens cannot be negative: {event.output_tokens}")
-        if event.response_time_ms < EMPTY_THRESHOLD:
-            raise ValueError(f"response_time_ms cannot be negative: {event.response_time_ms}")
+        input_tokens = event.input_tokens
+        output_tokens = event.output_tokens
+        response_time_ms = event.response_time_ms
 
+        # Validate non-negative values
+        if input_tokens < EMPTY_THRESHOLD:
+            raise ValueError(f"input_tokens cannot be negative: {input_tokens}")
+        if output_tokens < EMPTY_THRESHOLD:
+            raise ValueError(f"output_tokens cannot be negative: {output_tokens}")
+        if response_time_ms < EMPTY_THRESHOLD:
+            raise ValueError(f"response_time_ms cannot be negative: {response_time_ms}")
+
+        # Without a model name there is nothing to price, so skip the LiteLLM lookup
         cost_usd = DEFAULT_COST_USD
-        if event.input_tokens > EMPTY_THRESHOLD:
+        if input_tokens > EMPTY_THRESHOLD and event.model:
             cost_usd = calculate_cost(
                 model=event.model,
-                input_tokens=event.input_tokens,
-                output_tokens=event.output_tokens,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
             )
 
         return MessageMetadata(
-            input_tokens=event.input_tokens,
-            output_tokens=event.output_tokens,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
             model=event.model,
-            response_time_ms=event.response_time_ms,
+            response_time_ms=response_time_ms,
             cost_usd=cost_usd,
         )
 
@@ -198,7 +184,7 @@ class MetadataService:
             cost_usd=metadata.cost_usd,
         )
 
-    def apply_to_message(self, message: Message, metadata: MessageMetadata) -> None:
+    def apply_to_message(self, message: Message, metadata: MessageMetadata | StreamingResult) -> None:
         """Apply metadata to a message model.
 
         Sets metadata fields on the message, using None for zero/empty values
@@ -206,11 +192,14 @@ class MetadataService:
 
         Args:
             message: Message model to update
-            metadata: Metadata to apply
+            metadata: Metadata to apply (a StreamingResult is read directly)
         """
-        nullable = self.to_nullable_dict(metadata)
-        for field in METADATA_FIELDS:
-            setattr(message, field, nullable[field])
+        # Same rules as to_nullable_dict, assigned directly without building the dict
+        message.input_tokens = metadata.input_tokens if metadata.input_tokens > EMPTY_THRESHOLD else None
+        message.output_tokens = metadata.output_tokens if metadata.output_tokens > EMPTY_THRESHOLD else None
+        message.model = metadata.model or None
+        message.response_time_ms = metadata.response_time_ms if metadata.response_time_ms > EMPTY_THRESHOLD else None
+        message.cost_usd = metadata.cost_usd if metadata.cost_usd > EMPTY_THRESHOLD else None
 
     def apply_streaming_result_to_message(
         self,
@@ -224,7 +213,7 @@ class MetadataService:
             result: StreamingResult containing metadata
         """
         message.content = result.content
-        self.apply_to_message(message, result.to_metadata())
+        self.apply_to_message(message, result)
 
     def to_response_dict(self, result: StreamingResult) -> dict:
         """Convert streaming result metadata to response dictionary.
@@ -237,7 +226,16 @@ class MetadataService:
         Returns:
             Dict with metadata fields for API response
         """
-        return self.to_nullable_dict(result.to_metadata())
+        return self.to_nullable_dict(result)
+
+
+@functools.lru_cache(maxsize=1)
+def get_shared_metadata_service() -> MetadataService:
+    """Return the process-wide MetadataService.
+
+    The service is stateless, so every request shares one instance.
+    """
+    return MetadataService()
 
 
-__all__ = ["MetadataService", "StreamingResult", "MessageMetadata"]
+__all__ = ["MetadataService", "StreamingResult", "MessageMetadata", "get_shared_metadata_service"]
@@ -49,9 +49,8 @@ class PasswordService:
         # Hash new password
         new_password_hash = hash_password(new_password)
 
-        # Update password (session commit/rollback handled by request hooks)
+        # Update password (flushed by the request hook's commit, rollback on error)
         user.password_hash = new_password_hash
-        self.session.flush()
 
         logger.info(f"Password changed successfully: user_id={user_id}, email={user.email}")
 
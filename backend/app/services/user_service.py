@@ -7,9 +7,12 @@ import logging
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import CannotDeleteAdminError, UserAlreadyExistsError, UserNotFoundError, UserServiceError
+from app.repositories.conversation_repository import ConversationRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import UserResponse
 from app.schemas.user import UserCreateResponse
+from app.services.cache_service import CacheService
+from app.services.conversation_service import conversation_detail_cache_key, conversation_list_cache_version_key
 from app.utils.password import hash_password
 from app.utils.password_generator import generate_initial_password
 
@@ -19,10 +22,17 @@ logger = logging.getLogger(__name__)
 class UserService:
     """Service for user management operations."""
 
-    def __init__(self, session: Session):
-        """Initialize service with database session."""
+    def __init__(self, session: Session, cache_service: CacheService | None = None):
+        """Initialize service with database session.
+
+        Args:
+            session: SQLAlchemy database session.
+            cache_service: Response cache. If None, uses the shared cache (disabled unless configured).
+        """
         self.session = session
         self.user_repo = UserRepository(session)
+        self.conversation_repo = ConversationRepository(session)
+        self.cache_service = cache_service or CacheService()
 
     def list_users(self) -> list[UserResponse]:
         """Get all users."""
@@ -104,6 +114,13 @@ class UserService:
             raise CannotDeleteAdminError()
 
         email = user.email
+        # The cascade removes the rows but not their cached responses
+        if self.cache_service.enabled:
+            self.cache_service.invalidate_on_commit(
+                self.session,
+                keys=tuple(conversation_detail_cache_key(user_id, uuid) for uuid in self.conversation_repo.find_uuids_by_user_id(user_id)),
+                version_keys=(conversation_list_cache_version_key(user_id),),
+            )
         self.user_repo.delete(user)
         logger.info(f"User deleted successfully: id={user_id}, email={email}")
 
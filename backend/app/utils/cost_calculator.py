@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
 
@@ -19,6 +20,30 @@ class CostCalculationResult:
     total_cost: float
 
 
+# Pricing is static per process, so identical (model, input, output) triples always cost the same.
+# Exceptions are not cached, so a failed lookup is retried and warned about on every call.
+@functools.lru_cache(maxsize=4096)
+def _calculate_total_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+) -> float:
+    """Look up the total cost with LiteLLM, raising if the model is not priced."""
+    input_cost, output_cost = cost_per_token(
+        model=model,
+        prompt_tokens=input_tokens,
+        completion_tokens=output_tokens,
+    )
+    total_cost = input_cost + output_cost
+    logger.debug(
+        f"Cost calculated for {model}: "
+        f"input={input_tokens} tokens (${input_cost:.6f}), "
+        f"output={output_tokens} tokens (${output_cost:.6f}), "
+        f"total=${total_cost:.6f}"
+    )
+    return total_cost
+
+
 def calculate_cost(
     model: str,
     input_tokens: int,
@@ -38,25 +63,16 @@ def calculate_cost(
     Returns:
         Total cost in USD
 
+    Successful results are memoized per (model, input_tokens, output_tokens), so
+    repeated token counts skip the LiteLLM lookup.
+
     Example:
         >>> cost = calculate_cost("claude-sonnet-4-5-20250929", 1000, 500)
         >>> print(f"${cost:.6f}")
         $0.010500
     """
     try:
-        input_cost, output_cost = cost_per_token(
-            model=model,
-            prompt_tokens=input_tokens,
-            completion_tokens=output_tokens,
-        )
-        total_cost = input_cost + output_cost
-        logger.debug(
-            f"Cost calculated for {model}: "
-            f"input={input_tokens} tokens (${input_cost:.6f}), "
-            f"output={output_tokens} tokens (${output_cost:.6f}), "
-            f"total=${total_cost:.6f}"
-        )
-        return total_cost
+        return _calculate_total_cost(model, input_tokens, output_tokens)
     except Exception as e:
         logger.warning(f"Failed to calculate cost for model {model}: {e}")
         # Return 0 if cost calculation fails (model not in LiteLLM's database)
@@ -13,6 +13,16 @@ from app.main import create_app, get_engine  # noqa: E402
 from app.models import Base  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def _clear_agent_cache():
+    """Isolate tests from the process-wide shared AgentService."""
+    from app.services.agent_service import clear_agent_cache
+
+    clear_agent_cache()
+    yield
+    clear_agent_cache()
+
+
 @pytest.fixture()
 def app(monkeypatch: pytest.MonkeyPatch, tmp_path):
     db_path = tmp_path / "test.db"
@@ -0,0 +1,178 @@
+"""Tests for ConversationRepository (conversation data access layer)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from app.models.conversation import Conversation
+from app.models.message import Message
+from app.repositories.conversation_repository import ConversationRepository
+
+
+@pytest.fixture
+def conversation_repo(app):
+    """Create ConversationRepository instance with test database session."""
+    from app.database import get_session
+
+    with app.app_context():
+        session = get_session()
+        yield ConversationRepository(session), session
+
+
+def _create_conversation(session, user_id: int, title: str, message_count: int) -> Conversation:
+    """Create a conversation with the given number of messages."""
+    conversation = Conversation(user_id=user_id, title=title)
+    session.add(conversation)
+    session.flush()
+    for i in range(message_count):
+        session.add(Message(conversation_id=conversation.id, role="user", content=f"Message {i}"))
+    session.flush()
+    return conversation
+
+
+class TestConversationRepositoryFindByUserIdWithMessageCount:
+    """Tests for ConversationRepository.find_by_user_id_with_message_count method."""
+
+    def test_returns_conversation_and_message_count_tuples(self, app, conversation_repo, test_user):
+        """Test that each row is a (conversation, message_count) tuple, including empty conversations."""
+        repo, session = conversation_repo
+        with app.app_context():
+            with_messages = _create_conversation(session, test_user, "With messages", 3)
+            empty = _create_conversation(session, test_user, "Empty", 0)
+
+            results, total = repo.find_by_user_id_with_message_count(user_id=test_user)
+
+            counts = {conversation.id: count for conversation, count in results}
+            assert total == 2
+            assert counts == {with_messages.id: 3, empty.id: 0}
+
+    def test_paginates_and_counts_total(self, app, conversation_repo, test_user):
+        """Test that per_page limits the rows while total counts all conversations."""
+        repo, session = conversation_repo
+        with app.app_context():
+            for i in range(3):
+                _create_conversation(session, test_user, f"Conversation {i}", 1)
+
+            results, total = repo.find_by_user_id_with_message_count(user_id=test_user, page=2, per_page=2)
+
+            assert total == 3
+            assert len(results) == 1
+
+    def test_counts_messages_of_each_page(self, app, conversation_repo, test_user):
+        """Test that every page pairs its own conversations with their message counts."""
+        repo, session = conversation_repo
+        with app.app_context():
+            expected = {_create_conversation(session, test_user, f"Conversation {i}", i).id: i for i in range(3)}
+
+            first, _ = repo.find_by_user_id_with_message_count(user_id=test_user, page=1, per_page=2)
+            second, _ = repo.find_by_user_id_with_message_count(user_id=test_user, page=2, per_page=2)
+
+            counts = {conversation.id: count for conversation, count in first + second}
+            assert counts == expected
+
+    def test_counts_total_past_last_page(self, app, conversation_repo, test_user):
+        """Test that a page past the end returns no rows but still the total."""
+        repo, session = conversation_repo
+        with app.app_context():
+            for i in range(2):
+                _create_conversation(session, test_user, f"Conversation {i}", 0)
+
+            results, total = repo.find_by_user_id_with_message_count(user_id=test_user, page=3, per_page=2)
+
+            assert results == []
+            assert total == 2
+
+
+class TestConversationRepositoryFindByUserIdWithMessageCountAfter:
+    """Tests for ConversationRepository.find_by_user_id_with_message_count_after method."""
+
+    def test_pages_after_cursor_with_counts(self, app, conversation_repo, test_user):
+        """Test that rows start after the cursor and has_more reports a following page."""
+        repo, session = conversation_repo
+        with app.app_context():
+            # Explicit timestamps: SQLite stores server defaults in a different text format than bound datetimes
+            created = []
+            for i in range(3):
+                timestamp = datetime(2025, 1, 1, 12, 0, i)
+                conversation = Conversation(user_id=test_user, title=f"Conversation {i}", updated_at=timestamp)
+                session.add(conversation)
+                session.flush()
+                session.add_all(Message(conversation_id=conversation.id, role="user", content="Hi", created_at=timestamp) for _ in range(i))
+                created.append(conversation)
+            session.flush()
+
+            first, has_more = repo.find_by_user_id_with_message_count_after(user_id=test_user, per_page=2)
+
+            assert [(conv.id, count) for conv, count in first] == [(created[2].id, 2), (created[1].id, 1)]
+            assert has_more is True
+
+            last = first[-1][0]
+            second, has_more = repo.find_by_user_id_with_message_count_after(user_id=test_user, cursor=(last.updated_at, last.id), per_page=2)
+
+            assert [(conv.id, count) for conv, count in second] == [(created[0].id, 0)]
+            assert has_more is False
+
+
+class TestConversationRepositoryFindByUuidWithMessages:
+    """Tests for ConversationRepository.find_by_uuid_with_messages method."""
+
+    def test_eager_loads_messages_and_tool_calls(self, app, conversation_repo, test_user):
+        """Test that messages and their tool calls are loaded without lazy loads."""
+        from sqlalchemy import inspect
+
+        from app.models.tool_call import ToolCall
+
+        repo, session = conversation_repo
+        with app.app_context():
+            conversation = _create_conversation(session, test_user, "With tools", 2)
+            message = conversation.messages[0]
+            session.add(ToolCall(message_id=message.id, tool_call_id="call_1", tool_name="add", input={"a": 1, "b": 2}))
+            session.commit()
+            uuid = conversation.uuid
+            session.expunge_all()
+
+            result = repo.find_by_uuid_with_messages(uuid)
+
+            assert result is not None
+            assert "messages" not in inspect(result).unloaded
+            assert len(result.messages) == 2
+            assert all("tool_calls" not in inspect(msg).unloaded for msg in result.messages)
+            assert sorted(len(msg.tool_calls) for msg in result.messages) == [0, 1]
+
+    def test_skips_tool_calls_when_not_requested(self, app, conversation_repo, test_user):
+        """Test that with_tool_calls=False loads messages only."""
+        from sqlalchemy import inspect
+
+        repo, session = conversation_repo
+        with app.app_context():
+            conversation = _create_conversation(session, test_user, "History only", 1)
+            session.commit()
+            uuid = conversation.uuid
+            session.expunge_all()
+
+            result = repo.find_by_uuid_with_messages(uuid, with_tool_calls=False)
+
+            assert result is not None
+            assert "messages" not in inspect(result).unloaded
+            assert "tool_calls" in inspect(result.messages[0]).unloaded
+
+    def test_returns_none_for_unknown_uuid(self, app, conversation_repo):
+        """Test that an unknown UUID returns None."""
+        repo, _ = conversation_repo
+        with app.app_context():
+            assert repo.find_by_uuid_with_messages("00000000-0000-0000-0000-000000000000") is None
+
+    def test_user_id_filters_other_owners(self, app, conversation_repo, test_user):
+        """Test that user_id limits the match to the owner's conversation."""
+        repo, session = conversation_repo
+        with app.app_context():
+            conversation = _create_conversation(session, test_user, "Owned", 1)
+            session.commit()
+
+            assert repo.find_by_uuid_with_messages(conversation.uuid, user_id=test_user) is conversation
+            assert repo.find_by_uuid_with_messages(conversation.uuid, user_id=test_user + 1) is None
+            assert repo.find_by_uuid(conversation.uuid, user_id=test_user + 1) is None
+            assert repo.exists_by_uuid(conversation.uuid) is True
+            assert repo.exists_by_uuid("00000000-0000-0000-0000-000000000000") is False
@@ -228,6 +228,65 @@ class TestMessageRepositoryFindByConversationId:
             assert result[0].content == "Conv 1 msg"
 
 
+class TestMessageRepositoryFindRecentRoleContentPairs:
+    """Tests for MessageRepository.find_recent_role_content_pairs method."""
+
+    def test_returns_role_content_pairs_in_order(self, app, message_repo, sample_conversation):
+        """Test that (role, content) pairs are returned in conversation order."""
+        repo, session = message_repo
+        with app.app_context():
+            repo.create(conversation_id=sample_conversation, role="user", content="First")
+            repo.create(conversation_id=sample_conversation, role="assistant", content="Second")
+
+            result = repo.find_recent_role_content_pairs(sample_conversation, 10)
+
+            assert result == [("user", "First"), ("assistant", "Second")]
+
+    def test_empty_conversation(self, app, message_repo, sample_conversation):
+        """Test that a conversation without messages returns no pairs."""
+        repo, session = message_repo
+        with app.app_context():
+            assert repo.find_recent_role_content_pairs(sample_conversation, 10) == []
+
+    def test_before_id_excludes_later_messages(self, app, message_repo, sample_conversation):
+        """Test that before_id limits the history to messages created earlier."""
+        repo, session = message_repo
+        with app.app_context():
+            repo.create(conversation_id=sample_conversation, role="user", content="First")
+            user_msg, _ = repo.create_exchange(sample_conversation, "Second")
+
+            result = repo.find_recent_role_content_pairs(sample_conversation, 10, before_id=user_msg.id)
+
+            assert result == [("user", "First")]
+
+    def test_limit_returns_newest_messages_oldest_first(self, app, message_repo, sample_conversation):
+        """Test that limit keeps the newest messages in conversation order."""
+        repo, session = message_repo
+        with app.app_context():
+            for content in ("First", "Second", "Third"):
+                repo.create(conversation_id=sample_conversation, role="user", content=content)
+
+            result = repo.find_recent_role_content_pairs(sample_conversation, 2)
+
+            assert result == [("user", "Second"), ("user", "Third")]
+
+
+class TestMessageRepositoryCreateExchange:
+    """Tests for MessageRepository.create_exchange method."""
+
+    def test_creates_user_message_and_assistant_placeholder(self, app, message_repo, sample_conversation):
+        """Test that both messages are persisted with IDs, user message first."""
+        repo, session = message_repo
+        with app.app_context():
+            user_msg, assistant_msg = repo.create_exchange(sample_conversation, "Hello")
+
+            assert user_msg.id is not None
+            assert assistant_msg.id > user_msg.id
+            assert (user_msg.role, user_msg.content) == ("user", "Hello")
+            assert (assistant_msg.role, assistant_msg.content) == ("assistant", "")
+            assert repo.find_recent_role_content_pairs(sample_conversation, 10) == [("user", "Hello"), ("assistant", "")]
+
+
 class TestMessageRepositoryUpdateMetadata:
     """Tests for MessageRepository.update_metadata method."""
 
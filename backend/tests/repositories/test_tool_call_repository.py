@@ -537,6 +537,20 @@ class TestToolCallRepositoryCreateBatch:
             for tc in result:
                 assert tc.id is not None
 
+    def test_create_batch_returns_persistent_instances_with_distinct_ids(self, app, tool_call_repo, sample_message):
+        """Test that batch-created tool calls are attached to the session with their generated IDs."""
+        from sqlalchemy import inspect
+
+        with app.app_context():
+            tool_calls = [ToolCallData(tool_call_id=f"call_{i}", tool_name="add", input_data={}) for i in range(3)]
+            tool_calls[0].complete(output="0")
+
+            result = tool_call_repo.create_batch(message_id=sample_message, tool_calls=tool_calls)
+
+            assert len({tc.id for tc in result}) == 3
+            assert all(inspect(tc).persistent for tc in result)
+            assert [tc.tool_call_id for tc in result] == ["call_0", "call_1", "call_2"]
+
     def test_create_batch_can_be_retrieved_by_find(self, app, tool_call_repo, sample_message):
         """Test that batch-created tool calls can be retrieved by find_by_message_id."""
         with app.app_context():
@@ -566,3 +580,24 @@ class TestToolCallRepositoryCreateBatch:
             assert len(found) == 2
             tool_call_ids = {tc.tool_call_id for tc in found}
             assert tool_call_ids == {"call_1", "call_2"}
+
+
+class TestToolCallRepositoryAddBatch:
+    """Tests for ToolCallRepository.add_batch method."""
+
+    def test_add_batch_is_written_on_next_flush(self, app, tool_call_repo, sample_message):
+        """Test that add_batch stages rows without I/O and the next flush inserts them."""
+        with app.app_context():
+            data = ToolCallData(tool_call_id="call_staged", tool_name="add", input_data={"a": 1, "b": 2})
+            data.complete(output="3")
+
+            staged = tool_call_repo.add_batch(message_id=sample_message, tool_calls=[data])
+
+            assert staged[0] in tool_call_repo.session.new
+            assert tool_call_repo.find_by_message_id(sample_message) == []
+
+            tool_call_repo.session.flush()
+
+            found = tool_call_repo.find_by_message_id(sample_message)
+            assert [tc.tool_call_id for tc in found] == ["call_staged"]
+            assert found[0].status == "success"
@@ -1,5 +1,9 @@
 """Tests for conversation routes."""
 
+import json
+
+from app.routes.conversation_routes import _format_sse
+
 # Valid UUID v4 format that doesn't exist in database
 NONEXISTENT_UUID = "00000000-0000-4000-8000-000000000000"
 
@@ -42,8 +46,8 @@ class TestConversationRoutes:
     def test_create_conversation_non_streaming(self, auth_client, mocker):
         """Test creating a conversation in non-streaming mode."""
         # Mock Agent service to avoid external API calls
-        mock_agent_service = mocker.patch("app.services.conversation_service.AgentService")
-        mock_agent_service.return_value.generate_title.return_value = "Test Title"
+        mock_get_agent_service = mocker.patch("app.services.conversation_service.get_shared_agent_service")
+        mock_get_agent_service.return_value.generate_title.return_value = "Test Title"
 
         response = auth_client.post(
             "/api/conversations",
@@ -352,3 +356,23 @@ class TestMessageRepository:
             assert len(messages) == 2
             assert messages[0].role == "user"
             assert messages[1].role == "assistant"
+
+
+class TestFormatSse:
+    """Tests for SSE frame encoding."""
+
+    def test_delta_matches_json_dumps(self):
+        """Delta frames should be byte-identical to the generic json.dumps encoding."""
+        for delta in ("Hello", 'quote " and \\ backslash\n', "こんにちは 😀", ""):
+            expected = f"event: content_delta\ndata: {json.dumps({'delta': delta})}\n\n".encode()
+            assert _format_sse("delta", {"delta": delta}) == expected
+
+    def test_other_events_use_mapped_sse_name(self):
+        """Non-delta events should be encoded under their mapped SSE event name."""
+        data = {"tool_call_id": "tc_1", "output": "3", "error": None}
+
+        assert _format_sse("tool_call_end", data) == f"event: tool_call_end\ndata: {json.dumps(data)}\n\n".encode()
+
+    def test_unmapped_event_returns_none(self):
+        """Events without an SSE mapping should not be sent."""
+        assert _format_sse("unknown", {}) is None
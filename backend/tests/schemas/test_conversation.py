@@ -0,0 +1,99 @@
+"""Tests for conversation and tool call response schemas."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.schemas.conversation import ConversationResponse, ConversationWithCountResponse, MessageResponse
+from app.schemas.tool_call import ToolCallResponse
+
+CREATED_AT = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _tool_call(**overrides) -> SimpleNamespace:
+    """Create a ToolCall-like row."""
+    fields = {
+        "id": 1,
+        "tool_call_id": "tc_1",
+        "tool_name": "add",
+        "input": {"a": 1, "b": 2},
+        "output": "3",
+        "error": None,
+        "status": "success",
+        "started_at": CREATED_AT,
+        "completed_at": CREATED_AT,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _message(**overrides) -> SimpleNamespace:
+    """Create a Message-like row."""
+    fields = {
+        "id": 10,
+        "role": "assistant",
+        "content": "Result: 3",
+        "tool_calls": [_tool_call()],
+        "created_at": CREATED_AT,
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "model": "claude-3",
+        "response_time_ms": 1000,
+        "cost_usd": Decimal("0.001500"),
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestFromOrmFast:
+    """Tests for the from_orm_fast constructors."""
+
+    def test_message_matches_model_validate(self):
+        """Test that from_orm_fast serializes like model_validate."""
+        row = _message()
+
+        fast = MessageResponse.from_orm_fast(row)
+
+        assert fast.model_dump(mode="json") == MessageResponse.model_validate(row, from_attributes=True).model_dump(mode="json")
+        assert fast.cost_usd == 0.0015
+
+    def test_message_without_tool_calls_skips_relationship(self):
+        """Test that with_tool_calls=False never reads the tool_calls attribute."""
+        row = _message(role="user", cost_usd=None)
+        del row.tool_calls
+
+        fast = MessageResponse.from_orm_fast(row, with_tool_calls=False)
+
+        assert fast.tool_calls == []
+        assert fast.cost_usd is None
+
+    def test_conversation_matches_model_validate(self):
+        """Test that ConversationResponse.from_orm_fast serializes like model_validate."""
+        row = SimpleNamespace(uuid="abc", title="Title", created_at=CREATED_AT, updated_at=CREATED_AT)
+
+        fast = ConversationResponse.from_orm_fast(row)
+
+        assert fast.model_dump(mode="json") == ConversationResponse.model_validate(row).model_dump(mode="json")
+
+    def test_conversation_with_count_matches_validated_model(self):
+        """Test that ConversationWithCountResponse.from_orm_fast serializes like the validated model."""
+        row = SimpleNamespace(uuid="abc", title="Title", created_at=CREATED_AT, updated_at=CREATED_AT)
+
+        fast = ConversationWithCountResponse.from_orm_fast(row, 3)
+        validated = ConversationWithCountResponse(uuid="abc", title="Title", message_count=3, created_at=CREATED_AT, updated_at=CREATED_AT)
+
+        assert fast.model_dump_json() == validated.model_dump_json()
+
+
+class TestToolCallDumpOrmJson:
+    """Tests for ToolCallResponse.dump_orm_json."""
+
+    def test_matches_model_dump_json_mode(self):
+        """Test that the hand-built dict equals the schema's JSON-mode dump."""
+        for started_at in (CREATED_AT, datetime(2025, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)):
+            for completed_at in (None, started_at):
+                row = _tool_call(started_at=started_at, completed_at=completed_at)
+
+                assert ToolCallResponse.dump_orm_json(row) == ToolCallResponse.model_validate(row).model_dump(mode="json")
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import dataclasses
+import threading
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from anthropic import APIConnectionError, APIStatusError, RateLimitError
 from httpx import Request, Response
-from langchain_core.messages import AIMessageChunk, ToolMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
 
 from app.constants.error_types import LLMErrorType
 from app.core.exceptions import (
@@ -20,7 +22,18 @@ from app.core.exceptions import (
     ProviderNotFoundError,
 )
 from app.providers import LLMConfig, create_provider
-from app.services.agent_service import AgentService, MessageCompleteEvent, RetryEvent, TextDeltaEvent, ToolCallEvent, ToolResultEvent
+from app.services.agent_service import (
+    AgentService,
+    MessageCompleteEvent,
+    RetryEvent,
+    TextDeltaEvent,
+    ToolCallEvent,
+    ToolResultEvent,
+    _STREAM_IDLE,
+    _prefetch_stream,
+    clear_agent_cache,
+    get_shared_agent_service,
+)
 from app.tools import ToolRegistry
 
 
@@ -131,6 +144,26 @@ class TestAgentServiceInit:
         assert call_kwargs.kwargs.get("prompt") == custom_prompt
 
 
+class TestSharedAgentService:
+    """Tests for the process-wide shared AgentService."""
+
+    @patch("app.services.agent_service.create_react_agent")
+    @patch("app.services.agent_service.create_provider")
+    def test_shared_agent_service_is_reused_until_cleared(self, mock_create_provider, mock_create_agent):
+        """Test that get_shared_agent_service builds one instance per process until the cache is cleared."""
+        mock_create_provider.return_value.provider_name = "anthropic"
+        mock_create_provider.return_value.model_name = "claude-3"
+
+        first = get_shared_agent_service()
+
+        assert get_shared_agent_service() is first
+        mock_create_provider.assert_called_once()
+
+        clear_agent_cache()
+
+        assert get_shared_agent_service() is not first
+
+
 class TestAgentServiceGenerateTitle:
     """Tests for AgentService.generate_title method."""
 
@@ -390,10 +423,9 @@ class TestAgentServiceGenerateResponse:
         service = AgentService()
         events = list(service.generate_response([{"role": "user", "content": "test"}]))
 
-        # Verify text has newline prefix
+        # Verify a separate newline delta precedes the text
         text_events = [e for e in events if isinstance(e, TextDeltaEvent)]
-        assert len(text_events) == 1
-        assert text_events[0].delta == "\nThe result is 42."
+        assert [e.delta for e in text_events] == ["\n", "The result is 42."]
 
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
@@ -433,9 +465,7 @@ class TestAgentServiceGenerateResponse:
         events = list(service.generate_response([{"role": "user", "content": "test"}]))
 
         text_events = [e for e in events if isinstance(e, TextDeltaEvent)]
-        assert len(text_events) == 2
-        assert text_events[0].delta == "\nHello"  # First text has newline
-        assert text_events[1].delta == " world"  # Second text has no newline
+        assert [e.delta for e in text_events] == ["\n", "Hello", " world"]  # Newline only before first text
 
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
@@ -479,9 +509,7 @@ class TestAgentServiceGenerateResponse:
         events = list(service.generate_response([{"role": "user", "content": "test"}]))
 
         text_events = [e for e in events if isinstance(e, TextDeltaEvent)]
-        assert len(text_events) == 2
-        assert text_events[0].delta == "\nFirst result"
-        assert text_events[1].delta == "\nSecond result"
+        assert [e.delta for e in text_events] == ["\n", "First result", "\n", "Second result"]
 
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
@@ -521,6 +549,64 @@ class TestAgentServiceGenerateResponse:
         assert len(complete_events) == 1
         assert complete_events[0].content == "\nThe answer is 42."
 
+    @patch("app.services.agent_service.create_react_agent")
+    def test_without_tools_streams_messages_only(self, mock_create_agent):
+        """Test that an agent without tools does not request the updates stream."""
+        mock_provider = MagicMock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3"
+        mock_provider.config.max_tokens = 4096
+        mock_provider.config.max_retries = 3
+        mock_provider.config.retry_delay = 1.0
+
+        mock_agent = MagicMock()
+        mock_agent.stream.return_value = iter([("messages", (AIMessageChunk(content="Hi"), {}))])
+        mock_create_agent.return_value = mock_agent
+
+        service = AgentService(provider=mock_provider, tool_registry=ToolRegistry())
+        events = list(service.generate_response([{"role": "user", "content": "hello"}]))
+
+        assert mock_agent.stream.call_args.kwargs["stream_mode"] == ["messages"]
+        assert [e.delta for e in events if isinstance(e, TextDeltaEvent)] == ["Hi"]
+        assert [e.content for e in events if isinstance(e, MessageCompleteEvent)] == ["Hi"]
+
+    @patch("app.services.agent_service.create_react_agent")
+    def test_non_streaming_uses_updates_mode_without_text_deltas(self, mock_create_agent):
+        """Test that stream=False skips token chunks and builds content from agent node messages."""
+        mock_provider = MagicMock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3"
+        mock_provider.config.max_retries = 0
+
+        tool_call_message = AIMessage(
+            content="Let me add.",
+            tool_calls=[{"id": "tc_1", "name": "add", "args": {"a": 1, "b": 2}}],
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        )
+        final_message = AIMessage(
+            content=[{"type": "text", "text": "Result: 3"}],
+            usage_metadata={"input_tokens": 20, "output_tokens": 7, "total_tokens": 27},
+        )
+        mock_agent = MagicMock()
+        mock_agent.stream.return_value = iter(
+            [
+                {"agent": {"messages": [tool_call_message]}},
+                {"tools": {"messages": [ToolMessage(content="3", tool_call_id="tc_1")]}},
+                {"agent": {"messages": [final_message]}},
+            ]
+        )
+        mock_create_agent.return_value = mock_agent
+
+        service = AgentService(provider=mock_provider)
+        events = list(service.generate_response([{"role": "user", "content": "1+2?"}], stream=False))
+
+        assert mock_agent.stream.call_args.kwargs["stream_mode"] == "updates"
+        assert not any(isinstance(e, TextDeltaEvent) for e in events)
+        assert [type(e) for e in events[:2]] == [ToolCallEvent, ToolResultEvent]
+        assert [e.content for e in events if isinstance(e, MessageCompleteEvent)] == ["Let me add.\nResult: 3"]
+        metadata = events[-1]
+        assert (metadata.input_tokens, metadata.output_tokens) == (30, 12)
+
 
 class TestAgentServiceConvertMessages:
     """Tests for AgentService._convert_messages method."""
@@ -709,14 +795,14 @@ class TestAgentServiceHelperMethods:
         ai_chunk = AIMessageChunk(content="Hello!")
         data: tuple[Any, Any] = (ai_chunk, {})
 
-        result = service._handle_messages_stream(data)
+        result = service._handle_messages_stream(*data)
 
         assert result == "Hello!"
 
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
-    def test_handle_messages_stream_with_invalid_data(self, mock_create_provider, mock_create_agent):
-        """Test _handle_messages_stream with invalid data."""
+    def test_stream_loop_skips_malformed_chunks(self, mock_create_provider, mock_create_agent):
+        """Test that malformed stream chunks and message payloads are skipped."""
         mock_llm = MagicMock()
         mock_provider = MagicMock()
         mock_provider.create_chat_model.return_value = mock_llm
@@ -727,11 +813,23 @@ class TestAgentServiceHelperMethods:
         mock_provider.config.retry_delay = 1.0
         mock_create_provider.return_value = mock_provider
 
+        mock_agent = MagicMock()
+        mock_agent.stream.return_value = iter(
+            [
+                None,
+                ("single",),
+                ("messages", None),
+                ("messages", ("single",)),
+                ("messages", (AIMessageChunk(content="Hello!"), {})),
+            ]
+        )
+        mock_create_agent.return_value = mock_agent
+
         service = AgentService()
+        events = list(service.generate_response([{"role": "user", "content": "Hi"}]))
 
-        assert service._handle_messages_stream(cast(Any, None)) is None
-        assert service._handle_messages_stream(cast(Any, ("single",))) is None
-        assert service._handle_messages_stream(cast(Any, "not a tuple")) is None
+        text_events = [e for e in events if isinstance(e, TextDeltaEvent)]
+        assert [e.delta for e in text_events] == ["Hello!"]
 
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
@@ -751,7 +849,7 @@ class TestAgentServiceHelperMethods:
         ai_chunk = AIMessageChunk(content="")
         data: tuple[Any, Any] = (ai_chunk, {})
 
-        result = service._handle_messages_stream(data)
+        result = service._handle_messages_stream(*data)
 
         assert result is None
 
@@ -774,7 +872,7 @@ class TestAgentServiceHelperMethods:
         tool_msg = ToolMessage(content="Tool output: 42", tool_call_id="call_123")
         data: tuple[Any, Any] = (tool_msg, {})
 
-        result = service._handle_messages_stream(data)
+        result = service._handle_messages_stream(*data)
 
         assert result is None
 
@@ -798,7 +896,7 @@ class TestAgentServiceHelperMethods:
         mock_chunk.content = "This should be ignored"
         data: tuple[Any, Any] = (mock_chunk, {})
 
-        result = service._handle_messages_stream(data)
+        result = service._handle_messages_stream(*data)
 
         assert result is None
 
@@ -820,7 +918,7 @@ class TestAgentServiceHelperMethods:
         mock_message = MagicMock()
         mock_message.tool_calls = [{"id": "call_1", "name": "add", "args": {"a": 1}}]
         node_output = {"messages": [mock_message]}
-        emitted: set[str] = set()
+        emitted: dict[str, None] = {}
 
         events = list(service._process_agent_node(node_output, emitted))
 
@@ -846,7 +944,7 @@ class TestAgentServiceHelperMethods:
         mock_message = MagicMock()
         mock_message.tool_calls = [{"id": "call_1", "name": "add", "args": {}}]
         node_output = {"messages": [mock_message]}
-        emitted = {"call_1"}  # Already emitted
+        emitted = {"call_1": None}  # Already emitted
 
         events = list(service._process_agent_node(node_output, emitted))
 
@@ -947,6 +1045,14 @@ class TestEventDataclasses:
         assert event.error_type == LLMErrorType.RATE_LIMIT
         assert event.delay == 1.0
 
+    def test_events_are_immutable_and_slotted(self):
+        """Test that events are frozen and carry no per-instance __dict__."""
+        event = TextDeltaEvent(delta="Hi")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.delta = "Bye"  # type: ignore[misc]
+        assert not hasattr(event, "__dict__")
+
 
 class TestAgentServiceRetry:
     """Tests for AgentService retry logic."""
@@ -1035,6 +1141,39 @@ class TestAgentServiceRetry:
         assert len(retry_events) == 1
         assert retry_events[0].error_type == LLMErrorType.CONNECTION
 
+    @patch("app.services.agent_service.time.sleep")
+    @patch("app.services.agent_service.create_react_agent")
+    @patch("app.services.agent_service.create_provider")
+    def test_retry_reuses_history_from_one_shot_iterator(self, mock_create_provider, mock_create_agent, mock_sleep):
+        """Test that a generator history is consumed once and every attempt gets the full history."""
+        mock_provider = MagicMock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3"
+        mock_provider.config.max_tokens = 4096
+        mock_provider.config.max_retries = 3
+        mock_provider.config.retry_delay = 1.0
+        mock_create_provider.return_value = mock_provider
+
+        ai_message_chunk = AIMessageChunk(content="Success!")
+        seen_histories = []
+
+        def side_effect(inputs, **kwargs):
+            seen_histories.append([msg.content for msg in inputs["messages"]])
+            if len(seen_histories) == 1:
+                raise APIConnectionError(request=Request("POST", "https://api.anthropic.com"))
+            return iter([("messages", (ai_message_chunk, {}))])
+
+        mock_agent = MagicMock()
+        mock_agent.stream.side_effect = side_effect
+        mock_create_agent.return_value = mock_agent
+
+        service = AgentService()
+        history = ({"role": role, "content": content} for role, content in [("user", "Hi"), ("assistant", "Hello"), ("user", "Again")])
+
+        list(service.generate_response(history))
+
+        assert seen_histories == [["Hi", "Hello", "Again"], ["Hi", "Hello", "Again"]]
+
     @patch("app.services.agent_service.time.sleep")
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
@@ -1134,8 +1273,8 @@ class TestAgentServiceRetry:
     @patch("app.services.agent_service.time.sleep")
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
-    def test_exponential_backoff_delay(self, mock_create_provider, mock_create_agent, mock_sleep):
-        """Test exponential backoff delay calculation."""
+    def test_backoff_delay_uses_decorrelated_jitter(self, mock_create_provider, mock_create_agent, mock_sleep):
+        """Test that each retry delay is drawn from [base_delay, previous_delay * 3]."""
         mock_llm = MagicMock()
         mock_provider = MagicMock()
         mock_provider.create_chat_model.return_value = mock_llm
@@ -1167,10 +1306,11 @@ class TestAgentServiceRetry:
 
         retry_events = [e for e in events if isinstance(e, RetryEvent)]
         assert len(retry_events) == 3
-        # Verify exponential backoff: 1.0, 2.0, 4.0
-        assert retry_events[0].delay == 1.0
-        assert retry_events[1].delay == 2.0
-        assert retry_events[2].delay == 4.0
+        prev_delay = 1.0
+        for event in retry_events:
+            assert 1.0 <= event.delay <= prev_delay * 3
+            prev_delay = event.delay
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [e.delay for e in retry_events]
 
     @patch("app.services.agent_service.create_react_agent")
     @patch("app.services.agent_service.create_provider")
@@ -1297,3 +1437,40 @@ class TestAgentServiceRetry:
 
         # Should not retry - only one call
         assert mock_agent.stream.call_count == 1
+
+
+class TestPrefetchStream:
+    """Tests for the read-ahead stream helpers."""
+
+    def test_prefetch_preserves_order(self):
+        """Test that prefetched items are yielded in source order."""
+        assert list(_prefetch_stream(iter(range(100)), maxsize=4)) == list(range(100))
+
+    def test_prefetch_reraises_source_error(self):
+        """Test that an upstream exception surfaces after the items read before it."""
+
+        def source():
+            yield 1
+            raise ValueError("boom")
+
+        stream = _prefetch_stream(source())
+
+        assert next(stream) == 1
+        with pytest.raises(ValueError, match="boom"):
+            next(stream)
+
+    def test_prefetch_reports_idle_once_per_stall(self):
+        """Test that a stalled source yields one idle marker, then the next item."""
+        release = threading.Event()
+
+        def source():
+            yield 1
+            release.wait()
+            yield 2
+
+        stream = _prefetch_stream(source(), idle_timeout=0.01)
+
+        assert next(stream) == 1
+        assert next(stream) is _STREAM_IDLE
+        release.set()
+        assert list(stream) == [2]
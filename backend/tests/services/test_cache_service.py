@@ -0,0 +1,144 @@
+"""Tests for CacheService (Redis-backed response cache)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+from sqlalchemy import text
+
+from app.services.cache_service import CacheService
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock Redis client."""
+    return MagicMock()
+
+
+class TestCacheServiceDisabled:
+    """Tests for CacheService without a configured backend."""
+
+    def test_disabled_without_configuration(self):
+        """Test that caching is disabled when CACHE_ENABLED/REDIS_HOST are not set."""
+        service = CacheService()
+
+        assert service.enabled is False
+        assert service.get("key") is None
+        service.set("key", "value", ttl=10)
+        service.delete("key")
+        service.bump_version("key:version")
+        assert service.get_version("key:version") == 0
+
+
+class TestCacheServiceOperations:
+    """Tests for CacheService read and write operations."""
+
+    def test_get_returns_cached_value(self, mock_client):
+        """Test that get returns the stored value."""
+        mock_client.get.return_value = '{"a": 1}'
+        service = CacheService(client=mock_client)
+
+        assert service.get("key") == '{"a": 1}'
+        mock_client.get.assert_called_once_with("key")
+
+    def test_set_stores_value_with_ttl(self, mock_client):
+        """Test that set stores the value with an expiry."""
+        service = CacheService(client=mock_client)
+
+        service.set("key", "value", ttl=30)
+
+        mock_client.set.assert_called_once_with("key", "value", ex=30)
+
+    def test_redis_errors_are_treated_as_misses(self, mock_client):
+        """Test that Redis errors do not propagate to callers."""
+        mock_client.get.side_effect = redis.ConnectionError("down")
+        mock_client.set.side_effect = redis.ConnectionError("down")
+        service = CacheService(client=mock_client)
+
+        assert service.get("key") is None
+        service.set("key", "value", ttl=30)
+
+    def test_get_decodes_bytes(self, mock_client):
+        """Test that get returns str even if the client does not decode responses."""
+        mock_client.get.return_value = b'{"a": 1}'
+        service = CacheService(client=mock_client)
+
+        assert service.get("key") == '{"a": 1}'
+
+    def test_get_version_defaults_to_zero(self, mock_client):
+        """Test that an unset version counter reads as 0."""
+        mock_client.get.side_effect = [None, "3"]
+        service = CacheService(client=mock_client)
+
+        assert service.get_version("convlist:1:version") == 0
+        assert service.get_version("convlist:1:version") == 3
+
+    def test_bump_version_increments_with_expiry(self, mock_client):
+        """Test that bump_version increments the counter and refreshes its expiry without scanning."""
+        pipeline = mock_client.pipeline.return_value
+        service = CacheService(client=mock_client)
+
+        service.bump_version("convlist:1:version")
+
+        pipeline.incr.assert_called_once_with("convlist:1:version")
+        pipeline.expire.assert_called_once()
+        pipeline.execute.assert_called_once()
+        mock_client.scan_iter.assert_not_called()
+
+
+class TestCacheServiceInvalidateOnCommit:
+    """Tests for CacheService.invalidate_on_commit method."""
+
+    def test_invalidates_after_commit(self, app, mock_client):
+        """Test that keys are deleted and versions bumped only once the session commits."""
+        from app.database import get_session
+
+        pipeline = mock_client.pipeline.return_value
+        service = CacheService(client=mock_client)
+
+        with app.app_context():
+            session = get_session()
+            session.execute(text("SELECT 1"))
+            service.invalidate_on_commit(session, keys=("conv:1:abc",), version_keys=("convlist:1:version",))
+            mock_client.delete.assert_not_called()
+            pipeline.incr.assert_not_called()
+
+            session.commit()
+
+        mock_client.delete.assert_called_once_with("conv:1:abc")
+        pipeline.incr.assert_called_once_with("convlist:1:version")
+
+    def test_rollback_discards_pending_invalidations(self, app, mock_client):
+        """Test that a rolled back transaction does not invalidate anything."""
+        from app.database import get_session
+
+        service = CacheService(client=mock_client)
+
+        with app.app_context():
+            session = get_session()
+            session.execute(text("SELECT 1"))
+            service.invalidate_on_commit(session, keys=("conv:1:abc",))
+            session.rollback()
+            session.execute(text("SELECT 1"))
+            session.commit()
+
+        mock_client.delete.assert_not_called()
+
+    def test_does_not_add_session_listeners(self, app, mock_client):
+        """Test that repeated invalidations leave the session's commit listeners unchanged."""
+        from app.database import get_session
+
+        service = CacheService(client=mock_client)
+
+        with app.app_context():
+            session = get_session()
+            listener_count = len(session.dispatch.after_commit)
+            for _ in range(3):
+                session.execute(text("SELECT 1"))
+                service.invalidate_on_commit(session, keys=("conv:1:abc",))
+                session.commit()
+
+            assert len(session.dispatch.after_commit) == listener_count
+        assert mock_client.delete.call_count == 3
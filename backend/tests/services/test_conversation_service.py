@@ -6,9 +6,18 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.core.exceptions import ConversationAccessDeniedError, ConversationNotFoundError
+from app.core.exceptions import ConversationAccessDeniedError, ConversationNotFoundError, InvalidConversationCursorError
 from app.repositories.tool_call_repository import ToolCallData
-from app.services.agent_service import MessageCompleteEvent, MessageMetadataEvent, RetryEvent, TextDeltaEvent, ToolCallEvent, ToolResultEvent
+from app.schemas.conversation import ConversationResponse
+from app.services.agent_service import (
+    MessageCompleteEvent,
+    MessageMetadataEvent,
+    RetryEvent,
+    StreamIdleEvent,
+    TextDeltaEvent,
+    ToolCallEvent,
+    ToolResultEvent,
+)
 from app.services.conversation_service import AgentStreamingResult, ConversationService
 from app.services.metadata_service import StreamingResult
 
@@ -67,7 +76,7 @@ class TestConversationServiceInit:
             assert service._agent_service is mock_agent
 
     def test_agent_service_lazy_creation(self, app):
-        """Test that agent service is created lazily when accessed."""
+        """Test that the shared agent service is fetched lazily when accessed."""
         from app.database import get_session
 
         with app.app_context():
@@ -76,13 +85,13 @@ class TestConversationServiceInit:
 
             assert service._agent_service is None
 
-            with patch("app.services.conversation_service.AgentService") as mock_class:
+            with patch("app.services.conversation_service.get_shared_agent_service") as mock_get:
                 mock_instance = MagicMock()
-                mock_class.return_value = mock_instance
+                mock_get.return_value = mock_instance
                 agent = service.agent_service
 
                 assert agent is mock_instance
-                mock_class.assert_called_once()
+                mock_get.assert_called_once()
 
 
 class TestListConversations:
@@ -144,6 +153,41 @@ class TestListConversations:
         assert result.meta.per_page <= 100
 
 
+class TestListConversationsAfter:
+    """Tests for ConversationService.list_conversations_after method."""
+
+    def test_follows_cursor_through_all_pages(self, app, conversation_service, test_user):
+        """Test that following next_cursor visits every conversation once in updated_at order."""
+        service, session = conversation_service
+
+        from datetime import datetime
+
+        from app.models.conversation import Conversation
+
+        # Two conversations share a timestamp so the id tie-breaker is exercised
+        for i, second in enumerate([0, 1, 1, 2, 3]):
+            session.add(Conversation(user_id=test_user, title=f"Conversation {i}", updated_at=datetime(2025, 1, 1, 12, 0, second)))
+        session.flush()
+
+        titles, cursor = [], None
+        while True:
+            result = service.list_conversations_after(test_user, cursor=cursor, per_page=2)
+            titles.extend(c.title for c in result.conversations)
+            if not result.meta.has_more:
+                assert result.meta.next_cursor is None
+                break
+            cursor = result.meta.next_cursor
+
+        assert titles == [f"Conversation {i}" for i in reversed(range(5))]
+
+    def test_invalid_cursor_raises(self, app, conversation_service, test_user):
+        """Test that a malformed cursor raises InvalidConversationCursorError."""
+        service, session = conversation_service
+
+        with pytest.raises(InvalidConversationCursorError):
+            service.list_conversations_after(test_user, cursor="not-a-cursor")
+
+
 class TestGetConversation:
     """Tests for ConversationService.get_conversation method."""
 
@@ -173,6 +217,65 @@ class TestGetConversation:
             service.get_conversation(conversation_with_messages["uuid"], 99999)
 
 
+class TestConversationCache:
+    """Tests for the response cache in list_conversations/get_conversation."""
+
+    def test_list_conversations_returns_cached_response(self, app, test_user):
+        """Test that a cached listing is returned without querying the database."""
+        from app.database import get_session
+        from app.schemas.conversation import ConversationListResponse, PaginationMeta
+
+        cached = ConversationListResponse(conversations=[], meta=PaginationMeta(total=7, page=1, per_page=20, total_pages=1))
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = cached.model_dump_json()
+        mock_cache.get_version.return_value = 4
+
+        with app.app_context():
+            service = ConversationService(get_session(), agent_service=MagicMock(), cache_service=mock_cache)
+            with patch.object(service.conversation_repo, "find_by_user_id_with_message_count") as mock_find:
+                result = service.list_conversations(test_user, page=1, per_page=20)
+
+        assert result.meta.total == 7
+        mock_find.assert_not_called()
+        mock_cache.get_version.assert_called_once_with(f"convlist:{test_user}:version")
+        mock_cache.get.assert_called_once_with(f"convlist:{test_user}:v4:1:20")
+
+    def test_get_conversation_caches_on_miss(self, app, conversation_with_messages):
+        """Test that a detail miss is loaded from the database and stored under an owner-scoped key."""
+        from app.database import get_session
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+        uuid, user_id = conversation_with_messages["uuid"], conversation_with_messages["user_id"]
+
+        with app.app_context():
+            service = ConversationService(get_session(), agent_service=MagicMock(), cache_service=mock_cache)
+            result = service.get_conversation(uuid, user_id)
+
+        assert len(result.messages) == 2
+        key, value, _ttl = mock_cache.set.call_args.args
+        assert key == f"conv:{user_id}:{uuid}"
+        assert value == result.model_dump_json()
+
+    def test_delete_conversation_invalidates_cache(self, app, conversation_with_messages):
+        """Test that deleting a conversation schedules invalidation of its cached entries."""
+        from app.database import get_session
+
+        mock_cache = MagicMock()
+        uuid, user_id = conversation_with_messages["uuid"], conversation_with_messages["user_id"]
+
+        with app.app_context():
+            session = get_session()
+            service = ConversationService(session, agent_service=MagicMock(), cache_service=mock_cache)
+            service.delete_conversation(uuid, user_id)
+
+        mock_cache.invalidate_on_commit.assert_called_once_with(
+            session,
+            keys=(f"conv:{user_id}:{uuid}",),
+            version_keys=(f"convlist:{user_id}:version",),
+        )
+
+
 class TestCreateConversation:
     """Tests for ConversationService.create_conversation method."""
 
@@ -241,34 +344,82 @@ class TestValidateConversationAccess:
 
         assert len(result.messages) == 2
 
+    def test_validate_access_errors(self, app, conversation_service, conversation_with_messages):
+        """Test that a missing conversation is 404 and another user's is 403."""
+        service, session = conversation_service
+
+        for with_messages in (False, True):
+            with pytest.raises(ConversationNotFoundError):
+                service.validate_conversation_access("nonexistent-uuid", conversation_with_messages["user_id"], with_messages=with_messages)
+            with pytest.raises(ConversationAccessDeniedError):
+                service.validate_conversation_access(conversation_with_messages["uuid"], 99999, with_messages=with_messages)
+
+    def test_validate_handle_success(self, app, conversation_service, conversation_with_messages):
+        """Test that validate_conversation_handle returns the id/owner/uuid handle."""
+        service, session = conversation_service
+        result = service.validate_conversation_handle(
+            conversation_with_messages["uuid"],
+            conversation_with_messages["user_id"],
+        )
+
+        assert (result.id, result.user_id, result.uuid) == (
+            conversation_with_messages["id"],
+            conversation_with_messages["user_id"],
+            conversation_with_messages["uuid"],
+        )
+
+    def test_validate_handle_errors(self, app, conversation_service, conversation_with_messages):
+        """Test that validate_conversation_handle raises the same errors as full validation."""
+        service, session = conversation_service
+
+        with pytest.raises(ConversationNotFoundError):
+            service.validate_conversation_handle("nonexistent-uuid", conversation_with_messages["user_id"])
+        with pytest.raises(ConversationAccessDeniedError):
+            service.validate_conversation_handle(conversation_with_messages["uuid"], 99999)
 
-class TestBuildMessageHistory:
-    """Tests for ConversationService._build_message_history method."""
 
-    def test_build_message_history_empty(self, app, conversation_service):
+class TestIterMessageHistory:
+    """Tests for ConversationService._iter_message_history method."""
+
+    def test_iter_message_history_empty(self, app, conversation_service):
         """Test building history with no existing messages."""
         service, session = conversation_service
-        result = service._build_message_history([], "New message")
+        result = list(service._iter_message_history([], "New message"))
 
         assert len(result) == 1
         assert result[0]["role"] == "user"
         assert result[0]["content"] == "New message"
 
-    def test_build_message_history_with_existing(self, app, conversation_service):
+    def test_iter_message_history_with_existing(self, app, conversation_service):
         """Test building history with existing messages."""
         service, session = conversation_service
 
         existing = [
-            MagicMock(role="user", content="First"),
-            MagicMock(role="assistant", content="Response"),
+            ("user", "First"),
+            ("assistant", "Response"),
         ]
-        result = service._build_message_history(existing, "Second")
+        result = list(service._iter_message_history(existing, "Second"))
 
         assert len(result) == 3
         assert result[0]["content"] == "First"
         assert result[1]["content"] == "Response"
         assert result[2]["content"] == "Second"
 
+    def test_iter_message_history_drops_oldest_past_char_budget(self, app, conversation_service):
+        """Test that the oldest messages are dropped once the budget is spent and the window opens on a user message."""
+        service, session = conversation_service
+
+        existing = [
+            ("user", "a" * 10),
+            ("assistant", "b" * 10),
+            ("user", "c" * 10),
+            ("assistant", "d" * 10),
+        ]
+        with patch("app.services.conversation_service.MESSAGE_HISTORY_MAX_CHARS", 30):
+            result = list(service._iter_message_history(existing, "New"))
+
+        assert [(m["role"], m["content"]) for m in result] == [("user", "c" * 10), ("assistant", "d" * 10), ("user", "New")]
+
 
 class TestProcessAgentEvent:
     """Tests for ConversationService._process_agent_event method."""
@@ -521,6 +672,41 @@ class TestFinalizeStreamingResponse:
         assert len(db_tool_calls) == 2
 
 
+class TestSendMessage:
+    """Tests for ConversationService.send_message method."""
+
+    def test_send_message_returns_inserted_tool_calls_without_lazy_load(self, app, conversation_service, conversation_with_messages):
+        """Test that the response carries the inserted tool calls and no tool_calls SELECT is issued."""
+        from sqlalchemy import event
+
+        service, session = conversation_service
+        service._agent_service.generate_response.return_value = iter(
+            [
+                ToolCallEvent(tool_call_id="tc_1", tool_name="add", input={"a": 1, "b": 2}),
+                ToolResultEvent(tool_call_id="tc_1", output="3", error=None),
+                MessageCompleteEvent(content="Result: 3"),
+                MessageMetadataEvent(input_tokens=10, output_tokens=5, model="claude-3", response_time_ms=100),
+            ]
+        )
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = service.send_message(conversation_with_messages["uuid"], conversation_with_messages["user_id"], "Add 1+2")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert [tc.tool_call_id for tc in response.assistant_message.tool_calls] == ["tc_1"]
+        assert response.assistant_message.content == "Result: 3"
+        # create_batch's flush fills in the ids, so nothing selects from tool_calls
+        assert sum(1 for s in statements if s.lstrip().upper().startswith("SELECT") and "FROM tool_calls" in s) == 0
+
+
 class TestStreamingMethods:
     """Tests for streaming methods in ConversationService."""
 
@@ -544,6 +730,20 @@ class TestStreamingMethods:
         assert "conversation" in events[0][1]
         assert "user_message_id" in events[0][1]
 
+    def test_create_conversation_streaming_created_event_matches_schema(self, app, conversation_service, test_user):
+        """Test that the hand-built created payload has ConversationResponse's JSON shape."""
+        service, session = conversation_service
+
+        service._agent_service.generate_response.return_value = iter([MessageCompleteEvent(content="Hello")])
+
+        events = list(service.create_conversation_streaming(test_user, "Hi"))
+
+        payload = events[0][1]["conversation"]
+        from app.models.conversation import Conversation
+
+        conversation = session.query(Conversation).filter_by(uuid=payload["uuid"]).one()
+        assert payload == ConversationResponse.model_validate(conversation).model_dump(mode="json")
+
     def test_create_conversation_streaming_yields_end_event(self, app, conversation_service, test_user):
         """Test that create_conversation_streaming yields end event last."""
         service, session = conversation_service
@@ -684,6 +884,54 @@ class TestStreamAgentResponse:
         assert events[0][0] == "delta"
         assert events[1][0] == "delta"
 
+    def test_stream_agent_response_coalesces_delta_bursts(self, app, conversation_service):
+        """Test that deltas after the first are merged until a size limit or another event."""
+        service, session = conversation_service
+
+        service._agent_service.generate_response.return_value = iter(
+            [
+                TextDeltaEvent(delta="A"),
+                *[TextDeltaEvent(delta="b" * 16) for _ in range(5)],
+                TextDeltaEvent(delta="c"),
+                ToolCallEvent(tool_call_id="tc_1", tool_name="add", input={"a": 1, "b": 2}),
+                TextDeltaEvent(delta="d"),
+                TextDeltaEvent(delta="e"),
+                MessageCompleteEvent(content="A" + "b" * 80 + "cde"),
+                MessageMetadataEvent(input_tokens=10, output_tokens=5, model="claude-3", response_time_ms=100),
+            ]
+        )
+
+        tool_call_buffer: dict[str, ToolCallData] = {}
+        with patch("app.services.conversation_service.STREAM_DELTA_COALESCE_SECONDS", 60.0):
+            events = list(service._stream_agent_response([{"role": "user", "content": "Hi"}], tool_call_buffer))
+
+        assert [(event_type, data.get("delta")) for event_type, data in events] == [
+            ("delta", "A"),
+            ("delta", "b" * 64),
+            ("delta", "b" * 16 + "c"),
+            ("tool_call_start", None),
+            ("delta", "de"),
+        ]
+
+    def test_stream_agent_response_flushes_held_text_on_idle(self, app, conversation_service):
+        """Test that an upstream stall sends held text and restarts the coalescing window."""
+        service, session = conversation_service
+
+        service._agent_service.generate_response.return_value = iter(
+            [
+                TextDeltaEvent(delta="A"),
+                TextDeltaEvent(delta="b"),
+                StreamIdleEvent(),
+                TextDeltaEvent(delta="c"),
+                MessageCompleteEvent(content="Abc"),
+            ]
+        )
+
+        with patch("app.services.conversation_service.STREAM_DELTA_COALESCE_SECONDS", 60.0):
+            events = list(service._stream_agent_response([{"role": "user", "content": "Hi"}], {}))
+
+        assert [data["delta"] for _, data in events] == ["A", "b", "c"]
+
     def test_stream_agent_response_buffers_tool_calls(self, app, conversation_service):
         """Test that _stream_agent_response buffers tool calls."""
         service, session = conversation_service
@@ -779,6 +1027,9 @@ class TestStreamingAbortHandling:
         except RuntimeError:
             pass  # Expected
 
+        # Tool calls are staged on the session; the request teardown commit writes them
+        session.flush()
+
         # Verify tool calls were persisted despite the error
         # Find the assistant message that was created
         from app.models.message import Message
@@ -800,6 +1051,38 @@ class TestStreamingAbortHandling:
         assert tool_calls[0].tool_call_id == "tc_abort_1"
         assert tool_calls[0].status == "success"
 
+    def test_send_message_streaming_keeps_partial_content_on_abort(self, app, conversation_service, conversation_with_messages):
+        """Test that text streamed before an interruption is kept on the assistant message."""
+        service, session = conversation_service
+
+        def generate_response_with_error(*args, **kwargs):
+            yield TextDeltaEvent(delta="Partial ")
+            yield TextDeltaEvent(delta="answer")
+            raise RuntimeError("Simulated API error")
+
+        service._agent_service.generate_response = generate_response_with_error
+
+        gen = service.send_message_streaming(
+            uuid=conversation_with_messages["uuid"],
+            user_id=conversation_with_messages["user_id"],
+            content="Test",
+        )
+        with pytest.raises(RuntimeError):
+            for _ in gen:
+                pass
+
+        session.flush()
+
+        from app.models.message import Message
+
+        latest_assistant = (
+            session.query(Message)
+            .filter(Message.conversation_id == conversation_with_messages["id"], Message.role == "assistant")
+            .order_by(Message.id.desc())
+            .first()
+        )
+        assert latest_assistant.content == "Partial answer"
+
 
 class TestStreamingResultDataclass:
     """Tests for StreamingResult dataclass."""
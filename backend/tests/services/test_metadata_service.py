@@ -1,25 +1,17 @@
 """Tests for MetadataService."""
 
+import dataclasses
+from unittest.mock import patch
+
 import pytest
 
 from app.services.agent_service import MessageMetadataEvent
-from app.services.metadata_service import METADATA_FIELDS, MessageMetadata, MetadataService, StreamingResult, _to_nullable
-
-
-class TestToNullable:
-    """Tests for _to_nullable helper function."""
-
-    def test_returns_value_when_not_empty(self):
-        """Should return the original value when is_empty is False."""
-        assert _to_nullable(100, is_empty=False) == 100
-        assert _to_nullable(3.14, is_empty=False) == 3.14
-        assert _to_nullable("test", is_empty=False) == "test"
-
-    def test_returns_none_when_empty(self):
-        """Should return None when is_empty is True."""
-        assert _to_nullable(100, is_empty=True) is None
-        assert _to_nullable(3.14, is_empty=True) is None
-        assert _to_nullable("test", is_empty=True) is None
+from app.services.metadata_service import (
+    MessageMetadata,
+    MetadataService,
+    StreamingResult,
+    get_shared_metadata_service,
+)
 
 
 class TestMessageMetadata:
@@ -51,12 +43,25 @@ class TestMessageMetadata:
         assert metadata.response_time_ms == 500
         assert metadata.cost_usd == 0.01
 
+    def test_empty_is_shared_and_frozen(self):
+        """Should return one immutable empty instance."""
+        metadata = MessageMetadata.empty()
+
+        assert MessageMetadata.empty() is metadata
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metadata.input_tokens = 1
+
+    def test_has_no_instance_dict(self):
+        """Should use slots instead of a per-instance __dict__."""
+        assert not hasattr(MessageMetadata.empty(), "__dict__")
+        assert not hasattr(StreamingResult("", 0, 0, "", 0, 0.0), "__dict__")
+
 
 class TestStreamingResult:
     """Tests for StreamingResult dataclass."""
 
-    def test_to_metadata_converts_correctly(self):
-        """Should convert StreamingResult to MessageMetadata."""
+    def test_metadata_fields_read_like_message_metadata(self):
+        """Should give the same nullable dict as the equivalent MessageMetadata."""
         result = StreamingResult(
             content="Hello",
             input_tokens=100,
@@ -65,15 +70,17 @@ class TestStreamingResult:
             response_time_ms=500,
             cost_usd=0.01,
         )
+        metadata = MessageMetadata(
+            input_tokens=100,
+            output_tokens=50,
+            model="claude-3",
+            response_time_ms=500,
+            cost_usd=0.01,
+        )
 
-        metadata = result.to_metadata()
+        service = MetadataService()
 
-        assert isinstance(metadata, MessageMetadata)
-        assert metadata.input_tokens == 100
-        assert metadata.output_tokens == 50
-        assert metadata.model == "claude-3"
-        assert metadata.response_time_ms == 500
-        assert metadata.cost_usd == 0.01
+        assert service.to_nullable_dict(result) == service.to_nullable_dict(metadata)
 
 
 class TestMetadataService:
@@ -178,6 +185,13 @@ class TestMetadataService:
             assert result["response_time_ms"] == 500
             assert result["cost_usd"] == 0.01
 
+        def test_converts_negative_values_to_none(self, service):
+            """Should treat negative numbers as empty, like zero."""
+            metadata = MessageMetadata(input_tokens=-1, output_tokens=-1, model="", response_time_ms=-1, cost_usd=-0.5)
+            result = service.to_nullable_dict(metadata)
+
+            assert set(result.values()) == {None}
+
     class TestBuildFromEvent:
         """Tests for build_from_event method."""
 
@@ -206,6 +220,21 @@ class TestMetadataService:
             assert result.model == "claude-3"
             assert result.response_time_ms == 500
 
+        def test_skips_cost_without_model(self, service):
+            """Should not price tokens when the event has no model name."""
+            event = MessageMetadataEvent(
+                input_tokens=100,
+                output_tokens=50,
+                model="",
+                response_time_ms=500,
+            )
+            with patch("app.services.metadata_service.calculate_cost") as mock_cost:
+                result = service.build_from_event(event)
+
+            mock_cost.assert_not_called()
+            assert result.cost_usd == 0.0
+            assert result.input_tokens == 100
+
         def test_raises_error_for_negative_input_tokens(self, service):
             """Should raise ValueError for negative input_tokens."""
             event = MessageMetadataEvent(
@@ -277,8 +306,8 @@ class TestMetadataService:
 
             class MockMessage:
                 def __init__(self):
-                    for field in METADATA_FIELDS:
-                        setattr(self, field, None)
+                    for field in dataclasses.fields(MessageMetadata):
+                        setattr(self, field.name, None)
 
             message = MockMessage()
             metadata = MessageMetadata(
@@ -302,8 +331,8 @@ class TestMetadataService:
 
             class MockMessage:
                 def __init__(self):
-                    for field in METADATA_FIELDS:
-                        setattr(self, field, "placeholder")
+                    for field in dataclasses.fields(MessageMetadata):
+                        setattr(self, field.name, "placeholder")
 
             message = MockMessage()
             metadata = MessageMetadata.empty()
@@ -339,10 +368,12 @@ class TestMetadataService:
             assert response["cost_usd"] == 0.01
 
 
-class TestMetadataFields:
-    """Tests for METADATA_FIELDS constant."""
+class TestGetSharedMetadataService:
+    """Tests for get_shared_metadata_service."""
+
+    def test_returns_same_instance(self):
+        """Should return one MetadataService per process."""
+        service = get_shared_metadata_service()
 
-    def test_contains_expected_fields(self):
-        """Should contain all expected metadata field names."""
-        expected = ("input_tokens", "output_tokens", "model", "response_time_ms", "cost_usd")
-        assert METADATA_FIELDS == expected
+        assert isinstance(service, MetadataService)
+        assert get_shared_metadata_service() is service
@@ -192,6 +192,31 @@ def test_delete_user_cascades_related_data(app, user_service):
         assert token is None
 
 
+def test_delete_user_invalidates_cached_conversations(app):
+    """Test that deleting a user drops their cached conversation responses on commit."""
+    from unittest.mock import MagicMock
+
+    from app.database import get_session
+    from app.models.conversation import Conversation
+
+    user_id = create_user(app, email="user@example.com", password="password123", role="user")
+    mock_cache = MagicMock()
+
+    with app.app_context():
+        session = get_session()
+        conversation = Conversation(user_id=user_id, title="Cached")
+        session.add(conversation)
+        session.commit()
+
+        UserService(session, cache_service=mock_cache).delete_user(user_id)
+
+        mock_cache.invalidate_on_commit.assert_called_once_with(
+            session,
+            keys=(f"conv:{user_id}:{conversation.uuid}",),
+            version_keys=(f"convlist:{user_id}:version",),
+        )
+
+
 # reset_password tests
 
 
@@ -6,7 +6,15 @@ from unittest.mock import patch
 
 import pytest
 
-from app.utils.cost_calculator import CostCalculationResult, calculate_cost, calculate_cost_detailed
+from app.utils.cost_calculator import CostCalculationResult, _calculate_total_cost, calculate_cost, calculate_cost_detailed
+
+
+@pytest.fixture(autouse=True)
+def clear_cost_cache():
+    """Clear the calculate_cost memo so each test sees its own cost_per_token mock."""
+    _calculate_total_cost.cache_clear()
+    yield
+    _calculate_total_cost.cache_clear()
 
 
 class TestCalculateCost:
@@ -97,6 +105,28 @@ class TestCalculateCost:
 
             assert result == 4.5
 
+    def test_calculate_cost_memoized(self):
+        """Test that repeated arguments reuse the cached cost."""
+        with patch("app.utils.cost_calculator.cost_per_token") as mock_cost:
+            mock_cost.return_value = (0.003, 0.006)
+
+            first = calculate_cost(model="claude-sonnet-4-5-20250929", input_tokens=1000, output_tokens=500)
+            second = calculate_cost(model="claude-sonnet-4-5-20250929", input_tokens=1000, output_tokens=500)
+
+            assert first == second == pytest.approx(0.009)
+            mock_cost.assert_called_once()
+
+    def test_calculate_cost_failure_not_memoized(self):
+        """Test that a failed lookup is retried and warned about on every call."""
+        with patch("app.utils.cost_calculator.cost_per_token") as mock_cost, patch("app.utils.cost_calculator.logger") as mock_logger:
+            mock_cost.side_effect = Exception("Model not found in pricing database")
+
+            calculate_cost(model="unknown-model", input_tokens=1000, output_tokens=500)
+            calculate_cost(model="unknown-model", input_tokens=1000, output_tokens=500)
+
+            assert mock_cost.call_count == 2
+            assert mock_logger.warning.call_count == 2
+
 
 class TestCalculateCostDetailed:
     """Tests for calculate_cost_detailed function."""
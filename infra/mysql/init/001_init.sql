@@ -49,6 +49,7 @@ CREATE TABLE IF NOT EXISTS conversations (
 
 CREATE INDEX idx_conversations_user_id ON conversations (user_id);
 CREATE INDEX idx_conversations_updated_at ON conversations (updated_at);
+CREATE INDEX idx_conversations_user_id_updated_at ON conversations (user_id, updated_at);
 
 -- Messages table
 CREATE TABLE IF NOT EXISTS messages (
@@ -0,0 +1,13 @@
+-- Migration: Add composite index for per-user conversation listing
+-- Date: 2026-10-16
+-- Description: Covers WHERE user_id = ? ORDER BY updated_at DESC, id DESC so keyset
+--              pagination of a user's conversations seeks directly to the cursor
+--              (InnoDB appends the primary key id to secondary indexes)
+--
+-- IMPORTANT: This migration is for EXISTING databases only.
+-- New installations should use infra/mysql/init/001_init.sql instead.
+--
+-- Usage:
+--   poetry -C backend run python scripts/apply_sql_migrations.py
+
+CREATE INDEX idx_conversations_user_id_updated_at ON conversations (user_id, updated_at);